@@ -0,0 +1,192 @@
+import asyncio
+import contextlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Iterator, TypeVar
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest, MediaIoBaseDownload
+
+
+T = TypeVar('T')
+
+# Максимальна кількість одночасних блокуючих викликів Google Drive API
+DRIVE_MAX_CONCURRENCY = 16
+
+# Розмір частини при потоковому завантаженні файлів з Drive
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+_DRIVE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=DRIVE_MAX_CONCURRENCY,
+    thread_name_prefix='drive'
+)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """
+    Виконує блокуючий виклик у спільному обмеженому пулі потоків Drive.
+
+    Args:
+        func: Блокуюча функція (наприклад, request.execute)
+        *args: Аргументи функції
+
+    Returns:
+        Результат виклику функції
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DRIVE_EXECUTOR, func, *args)
+
+
+def shutdown_executor() -> None:
+    """
+    Скасовує заплановані блокуючі виклики Drive та звільняє пул потоків.
+
+    Потоки пулу не є daemon-потоками, тож при виході інтерпретатор
+    чекає на всі заплановані виклики; після скасування черги він чекає
+    лише на ті, що вже виконуються.
+    """
+    _DRIVE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
+@functools.lru_cache(maxsize=4)
+def get_drive_service(creds: Any) -> Any:
+    """
+    Повертає сервіс Google Drive API, спільний для всіх writer'ів і сховищ.
+
+    build() розбирає discovery-документ Drive, тому результат кешується
+    для кожного об'єкта credentials (за ідентичністю). Власне з'єднання
+    сервісу не використовується: запити з різних потоків виконуються
+    через execute_request зі з'єднаннями з пулу.
+
+    Args:
+        creds: Credentials користувача
+
+    Returns:
+        Resource сервісу Google Drive v3
+    """
+    return build('drive', 'v3', credentials=creds, static_discovery=True)
+
+
+def new_authorized_http(creds: Any) -> AuthorizedHttp:
+    """
+    Створює окреме авторизоване HTTP-з'єднання.
+
+    httplib2.Http не є потокобезпечним, тому паралельні запити через
+    спільний сервіс мають виконуватися кожен зі своїм з'єднанням.
+
+    Args:
+        creds: Credentials користувача
+
+    Returns:
+        AuthorizedHttp для передачі в request.execute(http=...)
+    """
+    return AuthorizedHttp(creds, http=httplib2.Http())
+
+
+class AuthorizedHttpPool:
+    """
+    Пул авторизованих HTTP-з'єднань для повторного використання.
+
+    Кожне з'єднання одночасно використовується лише одним запитом
+    (httplib2.Http не є потокобезпечним), але після завершення запиту
+    повертається в пул, тож наступні завантаження обходяться без
+    нового TCP/TLS рукостискання.
+    """
+
+    def __init__(self, creds: Any):
+        """
+        Args:
+            creds: Credentials користувача
+        """
+        self._creds = creds
+        self._idle: list[AuthorizedHttp] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[AuthorizedHttp]:
+        """
+        Видає вільне з'єднання з пулу або створює нове.
+
+        З'єднання повертається в пул лише після успішного запиту: після
+        помилки чи скасування воно може бути ще зайняте потоком пулу.
+
+        Yields:
+            AuthorizedHttp для передачі в request.http
+        """
+        with self._lock:
+            http = self._idle.pop() if self._idle else None
+        if http is None:
+            http = new_authorized_http(self._creds)
+
+        yield http
+
+        with self._lock:
+            if len(self._idle) < DRIVE_MAX_CONCURRENCY:
+                self._idle.append(http)
+
+
+@functools.lru_cache(maxsize=4)
+def get_http_pool(creds: Any) -> AuthorizedHttpPool:
+    """
+    Повертає пул з'єднань, спільний для всіх сховищ з тими ж credentials.
+
+    Args:
+        creds: Credentials користувача
+
+    Returns:
+        AuthorizedHttpPool для цих credentials
+    """
+    return AuthorizedHttpPool(creds)
+
+
+async def execute_request(request: Any, pool: AuthorizedHttpPool) -> Any:
+    """
+    Виконує запит (або batch-запит) у пулі потоків Drive на окремому з'єднанні.
+
+    Спільний сервіс використовується з кількох потоків одночасно, а
+    httplib2.Http не є потокобезпечним, тому кожен запит отримує
+    з'єднання з пулу на час виконання.
+
+    Args:
+        request: HttpRequest або BatchHttpRequest
+        pool: Пул з'єднань для credentials запиту
+
+    Returns:
+        Результат request.execute
+    """
+    with pool.connection() as http:
+        return await run_blocking(functools.partial(request.execute, http=http))
+
+
+async def download_media(request: HttpRequest, fh: IO[bytes]) -> None:
+    """
+    Потоково завантажує медіа-запит у файловий об'єкт частинами.
+
+    Кожна частина розміром DOWNLOAD_CHUNK_SIZE запитується окремо,
+    тому пікове споживання пам'яті обмежене розміром частини та fh.
+
+    При скасуванні наступні частини не запитуються, а виклик завершується
+    лише після того, як частина, що вже завантажується, допише у fh, тож
+    викликач може одразу закрити чи видалити файл.
+
+    Args:
+        request: Запит files().get_media(...)
+        fh: Файловий об'єкт для запису (BytesIO, тимчасовий файл тощо)
+    """
+    loop = asyncio.get_running_loop()
+    downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+    done = False
+    while not done:
+        chunk = loop.run_in_executor(_DRIVE_EXECUTOR, downloader.next_chunk)
+        try:
+            _, done = await asyncio.shield(chunk)
+        except asyncio.CancelledError:
+            # Потік пулу не перервати: чекаємо, доки він завершить запис
+            await asyncio.wait([chunk])
+            if not chunk.cancelled():
+                # Помилку частини перекриває скасування
+                chunk.exception()
+            raise
@@ -1,18 +1,32 @@
 import asyncio
+import json
 import logging
+import os
+import uuid
 from abc import ABC, abstractmethod
 from io import BytesIO
-from typing import Any
+from typing import Any, Awaitable, BinaryIO, Callable
 
-from googleapiclient.discovery import build
+import aiohttp
+from google.auth.transport.requests import Request
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseUpload
+from lxml import etree  # type: ignore
 
+from .drive_client import download_media, get_drive_service, get_http_pool, run_blocking
 from .google_auth_service import GoogleAuthService
 
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_URL = 'https://www.googleapis.com/upload/drive/v3/files'
+
+# Файли, менші за цей поріг, завантажуються одним multipart-запитом:
+# resumable-протокол потребує щонайменше двох round trip'ів
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# Розмір частини resumable-завантаження (має бути кратним 256 KiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class GoogleDriveFileWriter(ABC):
     """
@@ -31,16 +45,53 @@ class GoogleDriveFileWriter(ABC):
         """
         self.auth_service = auth_service
         self._drive_service = None
+        self._http_session: aiohttp.ClientSession | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
 
     def _get_drive_service(self):
         """Повертає сервіс Google Drive API."""
         if not self._drive_service:
             creds = self.auth_service.get_credentials()
-            self._drive_service = build('drive', 'v3', credentials=creds)
+            self._drive_service = get_drive_service(creds)
         return self._drive_service
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Повертає кешовану HTTP-сесію для поточного event loop.
+
+        Сесія прив'язана до loop'а, в якому створена, тому при зміні
+        loop'а створюється нова, а стара закривається у своєму loop'і.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_loop is not loop
+        ):
+            self._discard_http_session()
+            self._http_session = aiohttp.ClientSession()
+            self._http_loop = loop
+        return self._http_session
+
+    def _discard_http_session(self) -> None:
+        """Планує закриття відкритої сесії в loop'і, до якого вона прив'язана."""
+        session, loop = self._http_session, self._http_loop
+        self._http_session = None
+        self._http_loop = None
+        # Сесію можна закрити лише в її власному loop'і; якщо він уже
+        # зупинений, з'єднання звільняться разом з ним
+        if session and not session.closed and loop and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def _get_auth_headers(self) -> dict[str, str]:
+        """Повертає заголовок авторизації, оновлюючи токен за потреби."""
+        creds = self.auth_service.get_credentials()
+        if not creds.valid:
+            await run_blocking(creds.refresh, Request())
+        return {'Authorization': f'Bearer {creds.token}'}
+
     @abstractmethod
-    def _prepare_content(self, data: Any) -> str:
+    def _prepare_content(self, data: Any) -> bytes:
         """
         Фабричний метод для підготовки контенту в конкретному форматі.
 
@@ -48,7 +99,7 @@ class GoogleDriveFileWriter(ABC):
             data: Дані для конвертації
 
         Returns:
-            str: Підготовлений контент
+            bytes: Підготовлений контент у кодуванні UTF-8
         """
         pass
 
@@ -82,113 +133,312 @@ class GoogleDriveFileWriter(ABC):
         Raises:
             Exception: Якщо виникла помилка при збереженні
         """
-        loop = asyncio.get_event_loop()
+        # Підготовка контенту через фабричний метод
+        payload = self._prepare_content(data)
+        # Частини нарізаються без копіювання з уже закодованого буфера
+        view = memoryview(payload)
 
-        try:
-            # Підготовка контенту через фабричний метод
-            content = self._prepare_content(data)
+        async def read_range(start: int, end: int) -> memoryview:
+            return view[start:end]
 
-            # Створення медіа об'єкту
-            media = MediaIoBaseUpload(
-                BytesIO(content.encode('utf-8')),
-                mimetype=self._get_mime_type(),
-                resumable=True
-            )
+        return await self._save(len(payload), read_range, file_name, file_id)
 
-            drive_service = self._get_drive_service()
+    async def save_stream_to_drive(
+        self,
+        fileobj: BinaryIO,
+        file_name: str,
+        file_id: str | None = None
+    ) -> str:
+        """
+        Зберігає на Google Drive вміст бінарного файлового об'єкта.
 
-            if file_id:
-                # Оновлення існуючого файлу
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: drive_service.files().update(
-                        fileId=file_id,
-                        media_body=media
-                    ).execute()
-                )
-                logger.info(f"Оновлено файл {file_id}: {file_name}")
-                return file_id
+        Контент уже має бути у форматі writer'а; великі файли читаються
+        та надсилаються частинами по UPLOAD_CHUNK_SIZE, тому весь файл
+        ніколи не тримається в пам'яті.
+
+        Args:
+            fileobj: Бінарний файловий об'єкт з підтримкою seek
+            file_name: Назва файлу
+            file_id: ID існуючого файлу (для оновлення) або None для нового
+
+        Returns:
+            str: ID створеного/оновленого файлу
+
+        Raises:
+            Exception: Якщо виникла помилка при збереженні
+        """
+        def read(start: int, end: int) -> bytes:
+            fileobj.seek(start)
+            return fileobj.read(end - start)
+
+        async def read_range(start: int, end: int) -> bytes:
+            return await run_blocking(read, start, end)
+
+        total = await run_blocking(fileobj.seek, 0, os.SEEK_END)
+        return await self._save(total, read_range, file_name, file_id)
+
+    async def _save(
+        self,
+        total: int,
+        read_range: Callable[[int, int], Awaitable[bytes | memoryview]],
+        file_name: str,
+        file_id: str | None
+    ) -> str:
+        """
+        Обирає спосіб завантаження за розміром контенту та виконує його.
+
+        Args:
+            total: Розмір контенту в байтах
+            read_range: Повертає байти контенту з проміжку [start, end)
+            file_name: Назва файлу
+            file_id: ID існуючого файлу або None для нового
+
+        Returns:
+            str: ID створеного/оновленого файлу
+        """
+        try:
+            metadata = {} if file_id else {
+                'name': file_name,
+                'mimeType': self._get_mime_type()
+            }
+
+            if total >= RESUMABLE_THRESHOLD:
+                result_id = await self._upload_resumable(total, read_range, metadata, file_id)
+            elif file_id:
+                # Оновлення не змінює метадані, тож multipart-обгортка зайва
+                result_id = await self._upload_media(await read_range(0, total), file_id)
             else:
-                # Створення нового файлу
-                file_metadata = {
-                    'name': file_name,
-                    'mimeType': self._get_mime_type()
-                }
-
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: drive_service.files().create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields='id'
-                    ).execute()
+                result_id = await self._upload_multipart(
+                    await read_range(0, total), metadata, file_id
                 )
 
-                new_file_id = result.get('id')
-                logger.info(f"Створено новий файл {new_file_id}: {file_name}")
-                return new_file_id
+            if file_id:
+                logger.info("Оновлено файл %s: %s", file_id, file_name)
+            else:
+                logger.info("Створено новий файл %s: %s", result_id, file_name)
+            return result_id
 
-        except HttpError as error:
-            logger.error(f"Помилка при збереженні файлу: {error}")
-            raise Exception(f"Не вдалося зберегти файл: {error}")
+        except aiohttp.ClientError as error:
+            logger.error("Помилка при збереженні файлу: %s", error)
+            raise Exception(f"Не вдалося зберегти файл: {error}") from error
+
+    async def _upload_multipart(
+        self,
+        payload: bytes | memoryview,
+        metadata: dict[str, str],
+        file_id: str | None
+    ) -> str:
+        """
+        Завантажує метадані та контент одним multipart/related запитом.
+
+        Args:
+            payload: Закодований контент файлу
+            metadata: Метадані файлу
+            file_id: ID існуючого файлу або None для нового
+
+        Returns:
+            str: ID створеного/оновленого файлу
+        """
+        boundary = uuid.uuid4().hex
+        head = (
+            f'--{boundary}\r\n'
+            f'Content-Type: application/json; charset=UTF-8\r\n\r\n'
+            f'{json.dumps(metadata)}\r\n'
+            f'--{boundary}\r\n'
+            f'Content-Type: {self._get_mime_type()}\r\n\r\n'
+        )
+        tail = f'\r\n--{boundary}--'
+        body = head.encode('utf-8') + payload + tail.encode('utf-8')
+
+        headers = await self._get_auth_headers()
+        headers['Content-Type'] = f'multipart/related; boundary={boundary}'
+
+        session = self._get_http_session()
+        method, url = self._upload_target(file_id)
+        async with session.request(
+            method,
+            url,
+            params={'uploadType': 'multipart', 'fields': 'id'},
+            data=body,
+            headers=headers
+        ) as response:
+            response.raise_for_status()
+            result = await response.json()
+
+        return result['id']
+
+    async def _upload_media(self, payload: bytes | memoryview, file_id: str) -> str:
+        """
+        Оновлює контент існуючого файлу одним запитом без метаданих.
+
+        Args:
+            payload: Закодований контент файлу
+            file_id: ID існуючого файлу
 
-    async def download_from_drive(self, file_id: str) -> str:
+        Returns:
+            str: ID оновленого файлу
         """
-        Завантажує файл з Google Drive.
+        headers = await self._get_auth_headers()
+        headers['Content-Type'] = self._get_mime_type()
+
+        session = self._get_http_session()
+        method, url = self._upload_target(file_id)
+        async with session.request(
+            method,
+            url,
+            params={'uploadType': 'media', 'fields': 'id'},
+            data=payload,
+            headers=headers
+        ) as response:
+            response.raise_for_status()
+            result = await response.json()
+
+        return result['id']
+
+    async def _upload_resumable(
+        self,
+        total: int,
+        read_range: Callable[[int, int], Awaitable[bytes | memoryview]],
+        metadata: dict[str, str],
+        file_id: str | None
+    ) -> str:
+        """
+        Завантажує контент через resumable-протокол частинами по UPLOAD_CHUNK_SIZE.
+
+        Частини запитуються через read_range лише перед надсиланням,
+        тож у пам'яті одночасно перебуває не більше однієї частини.
+
+        Args:
+            total: Розмір контенту в байтах
+            read_range: Повертає байти контенту з проміжку [start, end)
+            metadata: Метадані файлу
+            file_id: ID існуючого файлу або None для нового
+
+        Returns:
+            str: ID створеного/оновленого файлу
+        """
+        headers = await self._get_auth_headers()
+        headers['X-Upload-Content-Type'] = self._get_mime_type()
+        headers['X-Upload-Content-Length'] = str(total)
+
+        session = self._get_http_session()
+        method, url = self._upload_target(file_id)
+
+        # Ініціалізація сесії завантаження
+        async with session.request(
+            method,
+            url,
+            params={'uploadType': 'resumable', 'fields': 'id'},
+            json=metadata,
+            headers=headers
+        ) as response:
+            response.raise_for_status()
+            session_uri = response.headers['Location']
+
+        start = 0
+        while True:
+            end = min(start + UPLOAD_CHUNK_SIZE, total)
+            async with session.put(
+                session_uri,
+                data=await read_range(start, end),
+                headers={'Content-Range': f'bytes {start}-{end - 1}/{total}'},
+                allow_redirects=False
+            ) as response:
+                if response.status != 308:
+                    response.raise_for_status()
+                    result = await response.json()
+                    return result['id']
+
+                # 308 Resume Incomplete: сервер повідомляє, скільки байт отримано
+                received = response.headers.get('Range')
+                start = int(received.rsplit('-', 1)[1]) + 1 if received else 0
+
+    @staticmethod
+    def _upload_target(file_id: str | None) -> tuple[str, str]:
+        """Повертає HTTP метод та URL для створення або оновлення файлу."""
+        if file_id:
+            return 'PATCH', f'{UPLOAD_URL}/{file_id}'
+        return 'POST', UPLOAD_URL
+
+    async def download_bytes_from_drive(self, file_id: str) -> bytes:
+        """
+        Завантажує файл з Google Drive без декодування.
 
         Args:
             file_id: ID файлу
 
         Returns:
-            str: Контент файлу
+            bytes: Сирий контент файлу
 
         Raises:
             Exception: Якщо виникла помилка при завантаженні
         """
-        loop = asyncio.get_event_loop()
-
         try:
             drive_service = self._get_drive_service()
+            media_request = drive_service.files().get_media(fileId=file_id)
 
-            result = await loop.run_in_executor(
-                None,
-                lambda: drive_service.files().get_media(
-                    fileId=file_id
-                ).execute()
-            )
+            # Спільний сервіс використовується з кількох потоків, тому
+            # завантаження йде власним з'єднанням з пулу
+            creds = self.auth_service.get_credentials()
+            buffer = BytesIO()
+            with get_http_pool(creds).connection() as http:
+                media_request.http = http
+                await download_media(media_request, buffer)
+            content = buffer.getvalue()
 
-            content = result.decode('utf-8')
-            logger.info(f"Завантажено файл {file_id}, розмір: {len(content)} байт")
+            logger.info("Завантажено файл %s, розмір: %s байт", file_id, len(content))
             return content
 
         except HttpError as error:
-            logger.error(f"Помилка при завантаженні файлу {file_id}: {error}")
+            logger.error("Помилка при завантаженні файлу %s: %s", file_id, error)
             raise Exception(f"Не вдалося завантажити файл: {error}")
 
+    async def download_text_from_drive(self, file_id: str) -> str:
+        """
+        Завантажує файл з Google Drive та декодує його як UTF-8.
+
+        Args:
+            file_id: ID файлу
+
+        Returns:
+            str: Контент файлу
+        """
+        return (await self.download_bytes_from_drive(file_id)).decode('utf-8')
+
     def reset_service(self):
         """Скидає кешований об'єкт сервісу Google Drive."""
         self._drive_service = None
 
+    async def close(self) -> None:
+        """Закриває HTTP-сесію, що використовується для завантаження."""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        self._http_loop = None
+
 
 class HTMLDriveWriter(GoogleDriveFileWriter):
     """
     Конкретний writer для збереження HTML файлів на Google Drive.
     """
 
-    def _prepare_content(self, data: Any) -> str:
+    def _prepare_content(self, data: Any) -> bytes:
         """
         Підготовка HTML контенту.
 
         Args:
-            data: HTML контент як рядок або dict з результатами трансформації
+            data: HTML контент як рядок, bytes або dict з результатами трансформації
 
         Returns:
-            str: HTML контент
+            bytes: HTML контент
         """
-        if isinstance(data, str):
+        if isinstance(data, dict) and 'html_content' in data:
+            data = data['html_content']
+
+        if isinstance(data, bytes):
             return data
-        elif isinstance(data, dict) and 'html_content' in data:
-            return data['html_content']
+        elif isinstance(data, str):
+            return data.encode('utf-8')
         else:
             raise ValueError("Невірний формат даних для HTML writer")
 
@@ -202,22 +452,28 @@ class XMLDriveWriter(GoogleDriveFileWriter):
     Конкретний writer для збереження XML файлів на Google Drive.
     """
 
-    def _prepare_content(self, data: Any) -> str:
+    def _prepare_content(self, data: Any) -> bytes:
         """
         Підготовка XML контенту.
 
         Args:
-            data: XML контент як рядок або об'єкт для конвертації в XML
+            data: XML контент як рядок/bytes, lxml дерево або об'єкт для конвертації в XML
 
         Returns:
-            str: XML контент
+            bytes: XML контент
         """
-        if isinstance(data, str):
-            # Якщо вже є XML рядок
+        if isinstance(data, bytes):
             return data
+        elif isinstance(data, str):
+            # Якщо вже є XML рядок
+            return data.encode('utf-8')
+        elif etree.iselement(data) or isinstance(data, etree._ElementTree):
+            # lxml серіалізує одразу в bytes без проміжного str
+            return etree.tostring(data, encoding='utf-8', xml_declaration=True)
         elif hasattr(data, 'to_xml'):
             # Якщо об'єкт має метод to_xml
-            return data.to_xml()
+            xml = data.to_xml()
+            return xml if isinstance(xml, bytes) else xml.encode('utf-8')
         else:
             raise ValueError("Невірний формат даних для XML writer")
 
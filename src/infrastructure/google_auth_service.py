@@ -1,5 +1,6 @@
+import functools
+import json
 import os
-import pickle
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +9,18 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 
+@functools.lru_cache(maxsize=1)
+def _load_token(token_path: str, mtime_ns: int, scopes: tuple[str, ...]) -> Credentials:
+    """
+    Завантажує credentials з JSON-файлу токену.
+
+    Кешується за (шлях, mtime), тому повторні виклики не читають диск,
+    доки файл токену не зміниться.
+    """
+    with open(token_path, 'r', encoding='utf-8') as token:
+        return Credentials.from_authorized_user_info(json.load(token), list(scopes))
+
+
 class GoogleAuthService:
     """
     Сервіс для управління автентифікацією Google OAuth 2.0.
@@ -23,6 +36,9 @@ class GoogleAuthService:
         'https://www.googleapis.com/auth/spreadsheets'
     ]
 
+    # Credentials, спільні для всіх екземплярів з однаковими шляхами
+    _shared_credentials: dict[tuple[str, str], Any] = {}
+
     def __init__(
         self,
         credentials_path: str | Any = None,
@@ -37,7 +53,11 @@ class GoogleAuthService:
         """
         self.credentials_path = credentials_path or self._get_default_credentials_path()
         self.token_path = token_path or self._get_default_token_path()
-        self._credentials: Credentials | Any = None
+        self._credentials: Credentials | Any = self._shared_credentials.get(self._cache_key())
+
+    def _cache_key(self) -> tuple[str, str]:
+        """Повертає ключ спільного кешу credentials."""
+        return str(self.credentials_path), str(self.token_path)
 
     def _get_default_credentials_path(self) -> str:
         """Повертає шлях до credentials.json за замовчуванням."""
@@ -49,7 +69,7 @@ class GoogleAuthService:
         home = Path.home()
         config_dir = home / ".config" / "spreadsheet-app"
         config_dir.mkdir(parents=True, exist_ok=True)
-        return str(config_dir / "token.pickle")
+        return str(config_dir / "token.json")
 
     def authenticate(self) -> Credentials | Any:
         """
@@ -68,8 +88,11 @@ class GoogleAuthService:
         creds = None
 
         if os.path.exists(self.token_path):
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+            creds = _load_token(
+                self.token_path,
+                os.stat(self.token_path).st_mtime_ns,
+                tuple(self.SCOPES)
+            )
 
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
@@ -88,10 +111,11 @@ class GoogleAuthService:
                 )
                 creds = flow.run_local_server(port=0)
 
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
+            with open(self.token_path, 'w', encoding='utf-8') as token:
+                token.write(creds.to_json())
 
         self._credentials = creds
+        self._shared_credentials[self._cache_key()] = creds
         return creds
 
     def get_credentials(self) -> Credentials:
@@ -126,4 +150,5 @@ class GoogleAuthService:
         """
         if os.path.exists(self.token_path):
             os.remove(self.token_path)
-        self._credentials = None
\ No newline at end of file
+        self._credentials = None
+        self._shared_credentials.pop(self._cache_key(), None)
\ No newline at end of file
@@ -1,16 +1,74 @@
 import asyncio
+import itertools
 import logging
-from typing import Any
+import os
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
 
-from googleapiclient.discovery import build
+import aiohttp
 from googleapiclient.errors import HttpError
 
+from .drive_client import (
+    AuthorizedHttpPool,
+    download_media,
+    execute_request,
+    get_drive_service,
+    get_http_pool,
+    run_blocking
+)
 from .google_auth_service import GoogleAuthService
-from .drive_file_writer import create_drive_writer
+from .drive_file_writer import GoogleDriveFileWriter, create_drive_writer
 
 
 logger = logging.getLogger(__name__)
 
+# Максимальна кількість запитів в одному batch-запиті Drive API
+DRIVE_BATCH_SIZE = 100
+
+# Поля файлу, що зберігаються в кеші списку
+_FILE_FIELDS = 'id, name, mimeType, modifiedTime'
+
+# Розмір, до якого потоково згенерований документ тримається в пам'яті,
+# перш ніж тимчасовий файл буде перенесено на диск
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Кількість спроб завантаження при тимчасових помилках
+UPLOAD_RETRIES = 3
+
+# Розширення файлів для кожного підтримуваного типу документа
+_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    'xml': ('.xml',),
+    'html': ('.html', '.htm'),
+    'xsl': ('.xsl', '.xslt')
+}
+
+# Готові кортежі розширень для всіх непорожніх комбінацій типів
+_SUFFIXES: dict[frozenset[str], tuple[str, ...]] = {
+    frozenset(combo): tuple(ext for ft in combo for ext in _EXTENSIONS[ft])
+    for size in range(1, len(_EXTENSIONS) + 1)
+    for combo in itertools.combinations(_EXTENSIONS, size)
+}
+
+
+def _suffixes_for(file_types: list[str]) -> tuple[str, ...]:
+    """Повертає кортеж розширень для заданих типів файлів."""
+    key = frozenset(ft.lower() for ft in file_types)
+    suffixes = _SUFFIXES.get(key)
+    if suffixes is None:
+        # Невідомі типи ігноруються
+        suffixes = _SUFFIXES.get(frozenset(key & _EXTENSIONS.keys()), ())
+    return suffixes
+
+
+def _is_transient(error: Exception) -> bool:
+    """Перевіряє, чи варто повторити завантаження після помилки."""
+    cause = error.__cause__
+    if isinstance(cause, aiohttp.ClientResponseError):
+        return cause.status == 429 or cause.status >= 500
+    return isinstance(cause, aiohttp.ClientConnectionError)
+
 
 class GoogleDriveDocumentStorage:
     """
@@ -32,14 +90,24 @@ class GoogleDriveDocumentStorage:
         """
         self.auth_service = auth_service
         self._drive_service = None
+        self._writers: dict[str, GoogleDriveFileWriter] = {}
+
+        # Кеш списку файлів: id -> метадані, та токен журналу змін Drive,
+        # з якого кеш оновлюється наступного разу
+        self._file_cache: dict[str, dict[str, Any]] = {}
+        self._changes_token: str | None = None
 
     def _get_drive_service(self):
         """Повертає сервіс Google Drive API."""
         if not self._drive_service:
             creds = self.auth_service.get_credentials()
-            self._drive_service = build('drive', 'v3', credentials=creds)
+            self._drive_service = get_drive_service(creds)
         return self._drive_service
 
+    def _get_http_pool(self) -> AuthorizedHttpPool:
+        """Повертає пул з'єднань; кожен запит виконується на окремому з них."""
+        return get_http_pool(self.auth_service.get_credentials())
+
     async def list_documents(
         self,
         file_types: list[str] | None = None
@@ -61,55 +129,131 @@ class GoogleDriveDocumentStorage:
         Raises:
             Exception: Якщо виникла помилка при отриманні списку файлів
         """
-        loop = asyncio.get_event_loop()
-
         if file_types is None:
             file_types = ['xml', 'html', 'xsl']
 
         try:
-            drive_service = self._get_drive_service()
-
-            # Завантажуємо всі файли (не в корзині)
-            response = await loop.run_in_executor(
-                None,
-                lambda: drive_service.files().list(
-                    q="trashed=false",
-                    spaces='drive',
-                    fields='files(id, name, mimeType, modifiedTime)',
-                    orderBy='modifiedTime desc',
-                    pageSize=1000  # Збільшуємо ліміт
-                ).execute()
-            )
-
-            all_files = response.get('files', [])
+            all_files = await self._refresh_file_cache()
 
             # Фільтруємо файли по розширенню на клієнті
-            filtered_files = []
-            for file in all_files:
-                file_name = file.get('name', '').lower()
-
-                for ft in file_types:
-                    if ft.lower() == 'xml' and file_name.endswith('.xml'):
-                        filtered_files.append(file)
-                        break
-                    elif ft.lower() == 'html' and (file_name.endswith('.html') or file_name.endswith('.htm')):
-                        filtered_files.append(file)
-                        break
-                    elif ft.lower() == 'xsl' and (file_name.endswith('.xsl') or file_name.endswith('.xslt')):
-                        filtered_files.append(file)
-                        break
-
-            logger.info(f"Знайдено {len(filtered_files)} документів ({len(all_files)} всього)")
+            suffixes = _suffixes_for(file_types)
+            filtered_files = [
+                file for file in all_files
+                if file.get('name', '').lower().endswith(suffixes)
+            ]
+
+            logger.info("Знайдено %s документів (%s всього)", len(filtered_files), len(all_files))
 
             return filtered_files
 
         except HttpError as error:
-            logger.error(f"Помилка при отриманні списку документів: {error}")
+            logger.error("Помилка при отриманні списку документів: %s", error)
             raise Exception(f"Не вдалося отримати список документів: {error}")
 
+    async def _refresh_file_cache(self) -> list[dict[str, Any]]:
+        """
+        Оновлює кеш списку файлів та повертає його вміст.
+
+        Перший виклик отримує всі файли; наступні запитують журнал змін
+        Drive (changes.list) з останнього збереженого токена, тож
+        видалені, переміщені в корзину та нові файли з будь-яким
+        modifiedTime потрапляють у кеш. Якщо токен більше не дійсний,
+        список отримується повністю заново.
+
+        Returns:
+            list[dict]: Файли, відсортовані за modifiedTime (новіші першими)
+        """
+        if self._changes_token is None:
+            await self._relist_files()
+        else:
+            try:
+                await self._apply_changes()
+            except HttpError as error:
+                if error.resp.status not in (404, 410):
+                    raise
+                # Токен застарів: журнал змін недоступний
+                await self._relist_files()
+
+        return sorted(
+            self._file_cache.values(),
+            key=lambda file: file.get('modifiedTime', ''),
+            reverse=True
+        )
+
+    async def _relist_files(self) -> None:
+        """Заповнює кеш повним списком файлів (не в корзині), сторінка за сторінкою."""
+        drive_service = self._get_drive_service()
+        pool = self._get_http_pool()
+
+        # Токен береться до списку, щоб зміни під час його отримання
+        # не загубилися: вони будуть застосовані наступного разу
+        token_response = await execute_request(
+            drive_service.changes().getStartPageToken(), pool
+        )
+
+        files: dict[str, dict[str, Any]] = {}
+        page_token = None
+        while True:
+            response = await execute_request(
+                drive_service.files().list(
+                    q="trashed=false",
+                    spaces='drive',
+                    fields=f'nextPageToken, files({_FILE_FIELDS})',
+                    pageSize=1000,
+                    pageToken=page_token
+                ),
+                pool
+            )
+            for file in response.get('files', []):
+                files[file['id']] = file
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        self._file_cache = files
+        self._changes_token = token_response['startPageToken']
+
+    async def _apply_changes(self) -> None:
+        """Зливає з кешем зміни, що відбулися після збереженого токена."""
+        drive_service = self._get_drive_service()
+        pool = self._get_http_pool()
+
+        page_token = self._changes_token
+        while True:
+            response = await execute_request(
+                drive_service.changes().list(
+                    pageToken=page_token,
+                    spaces='drive',
+                    includeRemoved=True,
+                    fields=(
+                        'nextPageToken, newStartPageToken, '
+                        f'changes(fileId, removed, file({_FILE_FIELDS}, trashed))'
+                    ),
+                    pageSize=1000
+                ),
+                pool
+            )
+            for change in response.get('changes', []):
+                file = change.get('file')
+                if change.get('removed') or not file or file.pop('trashed', False):
+                    self._file_cache.pop(change['fileId'], None)
+                else:
+                    self._file_cache[change['fileId']] = file
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                self._changes_token = response['newStartPageToken']
+                break
+
+    def invalidate_cache(self) -> None:
+        """Скидає кеш списку файлів; наступний запит отримає повний список."""
+        self._file_cache.clear()
+        self._changes_token = None
+
     async def upload_document(
         self,
-        content: str,
+        content: str | bytes,
         file_name: str,
         format_type: str,
         file_id: str | None = None
@@ -118,7 +262,7 @@ class GoogleDriveDocumentStorage:
         Завантажує документ на Google Drive.
 
         Args:
-            content: Контент документу (HTML або XML рядок)
+            content: Контент документу (HTML або XML рядок чи bytes)
             file_name: Назва файлу
             format_type: Тип формату ('html' або 'xml')
             file_id: ID існуючого файлу (якщо потрібно оновити), None для нового
@@ -130,19 +274,151 @@ class GoogleDriveDocumentStorage:
             Exception: Якщо виникла помилка при завантаженні
         """
         try:
-            # Використання фабричного методу для створення writer'а
-            writer = create_drive_writer(format_type, self.auth_service)
+            writer = self._get_writer(format_type)
 
             # Збереження через writer
             file_id = await writer.save_to_drive(content, file_name, file_id)
 
-            logger.info(f"Завантажено документ {file_name} ({format_type})")
+            logger.info("Завантажено документ %s (%s)", file_name, format_type)
             return file_id
 
         except Exception as error:
-            logger.error(f"Помилка при завантаженні документу: {error}")
+            logger.error("Помилка при завантаженні документу: %s", error)
             raise
 
+    async def upload_document_stream(
+        self,
+        write_content: Callable[[BinaryIO], None],
+        file_name: str,
+        format_type: str,
+        file_id: str | None = None
+    ) -> str:
+        """
+        Генерує документ у тимчасовий файл та завантажує його на Google Drive.
+
+        write_content виконується у фоновому потоці й записує готові bytes
+        у SpooledTemporaryFile, звідки writer читає їх частинами, тож
+        документ ніколи не тримається в пам'яті повністю.
+
+        Args:
+            write_content: Функція, що записує контент у бінарний файловий об'єкт
+            file_name: Назва файлу
+            format_type: Тип формату ('html' або 'xml')
+            file_id: ID існуючого файлу (якщо потрібно оновити), None для нового
+
+        Returns:
+            str: ID створеного/оновленого файлу
+
+        Raises:
+            Exception: Якщо виникла помилка при завантаженні
+        """
+        try:
+            writer = self._get_writer(format_type)
+
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+                await run_blocking(write_content, buffer)
+                file_id = await writer.save_stream_to_drive(buffer, file_name, file_id)
+
+            logger.info("Завантажено документ %s (%s)", file_name, format_type)
+            return file_id
+
+        except Exception as error:
+            logger.error("Помилка при завантаженні документу: %s", error)
+            raise
+
+    async def upload_documents(
+        self,
+        items: list[tuple[str, str, str] | tuple[str, str, str, str | None]],
+        max_concurrency: int = 8
+    ) -> list[str]:
+        """
+        Завантажує кілька документів паралельно з обмеженням одночасних запитів.
+
+        Оновлення існуючих файлів при тимчасових помилках мережі та
+        відповідях 429/5xx повторюються з експоненційною затримкою.
+        Створення не повторюється: запит, що завершився помилкою, міг уже
+        створити файл на сервері, і повтор дав би дублікат.
+
+        Args:
+            items: Список кортежів (content, file_name, format_type[, file_id])
+            max_concurrency: Максимальна кількість одночасних завантажень
+
+        Returns:
+            list[str]: ID завантажених файлів у порядку items
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def upload(
+            content: str,
+            file_name: str,
+            format_type: str,
+            file_id: str | None = None
+        ) -> str:
+            attempts = UPLOAD_RETRIES if file_id else 1
+            for attempt in range(attempts):
+                try:
+                    async with semaphore:
+                        return await self.upload_document(
+                            content, file_name, format_type, file_id
+                        )
+                except Exception as error:
+                    if attempt == attempts - 1 or not _is_transient(error):
+                        raise
+                # Під час затримки слот семафора доступний іншим завантаженням
+                await asyncio.sleep(2 ** attempt)
+
+        return await asyncio.gather(*(upload(*item) for item in items))
+
+    def _get_writer(self, format_type: str) -> GoogleDriveFileWriter:
+        """
+        Повертає кешований writer для формату.
+
+        Використовує фабричний метод для створення writer'а при першому зверненні.
+        """
+        key = format_type.lower()
+        writer = self._writers.get(key)
+        if writer is None:
+            writer = create_drive_writer(format_type, self.auth_service)
+            self._writers[key] = writer
+        return writer
+
+    async def _fetch_with_media(
+        self,
+        metadata_request: Any,
+        media_request: Any,
+        fh: BinaryIO
+    ) -> dict[str, Any]:
+        """
+        Запитує метадані та потоково завантажує контент у fh паралельно.
+
+        Якщо один із запитів завершився помилкою або виклик скасовано,
+        завантаження контенту скасовується й очікується, тож після
+        повернення fh більше не використовується і його можна закрити.
+
+        Args:
+            metadata_request: Запит files().get(...)
+            media_request: Запит files().get_media(...)
+            fh: Файловий об'єкт для запису контенту
+
+        Returns:
+            dict: Відповідь на запит метаданих
+        """
+        # httplib2.Http не є потокобезпечним, тому кожен запит іде
+        # окремим з'єднанням з пулу
+        pool = self._get_http_pool()
+        with pool.connection() as http:
+            media_request.http = http
+            media = asyncio.create_task(download_media(media_request, fh))
+            try:
+                file_metadata = await execute_request(metadata_request, pool)
+                await media
+            except BaseException:
+                media.cancel()
+                await asyncio.gather(media, return_exceptions=True)
+                raise
+
+        return file_metadata
+
     async def download_document(self, file_id: str) -> dict[str, Any]:
         """
         Завантажує документ з Google Drive.
@@ -159,31 +435,24 @@ class GoogleDriveDocumentStorage:
         Raises:
             Exception: Якщо виникла помилка при завантаженні
         """
-        loop = asyncio.get_event_loop()
-
         try:
             drive_service = self._get_drive_service()
 
-            # Отримання метаданих файлу
-            file_metadata = await loop.run_in_executor(
-                None,
-                lambda: drive_service.files().get(
-                    fileId=file_id,
-                    fields='name, mimeType'
-                ).execute()
+            metadata_request = drive_service.files().get(
+                fileId=file_id,
+                fields='name, mimeType'
             )
+            media_request = drive_service.files().get_media(fileId=file_id)
 
-            # Завантаження контенту
-            content_bytes = await loop.run_in_executor(
-                None,
-                lambda: drive_service.files().get_media(
-                    fileId=file_id
-                ).execute()
+            # Метадані та контент запитуються паралельно
+            buffer = BytesIO()
+            file_metadata = await self._fetch_with_media(
+                metadata_request, media_request, buffer
             )
 
-            content = content_bytes.decode('utf-8')
+            content = buffer.getvalue().decode('utf-8')
 
-            logger.info(f"Завантажено документ {file_id}: {file_metadata['name']}")
+            logger.info("Завантажено документ %s: %s", file_id, file_metadata['name'])
 
             return {
                 'content': content,
@@ -192,7 +461,67 @@ class GoogleDriveDocumentStorage:
             }
 
         except HttpError as error:
-            logger.error(f"Помилка при завантаженні документу {file_id}: {error}")
+            logger.error("Помилка при завантаженні документу %s: %s", file_id, error)
+            raise Exception(f"Не вдалося завантажити документ: {error}")
+
+    async def download_document_to_file(
+        self,
+        file_id: str,
+        target_dir: Path
+    ) -> dict[str, Any]:
+        """
+        Завантажує документ з Google Drive потоково у файл на диску.
+
+        Контент записується частинами по DOWNLOAD_CHUNK_SIZE, тому
+        в пам'яті ніколи не тримається весь файл.
+
+        Args:
+            file_id: ID файлу
+            target_dir: Каталог, у якому буде збережено файл під його назвою
+
+        Returns:
+            dict: Словник з даними:
+                - path: Шлях до збереженого файлу
+                - name: Назва файлу
+                - mimeType: MIME тип
+
+        Raises:
+            Exception: Якщо виникла помилка при завантаженні
+        """
+        try:
+            drive_service = self._get_drive_service()
+
+            metadata_request = drive_service.files().get(
+                fileId=file_id,
+                fields='name, mimeType'
+            )
+            media_request = drive_service.files().get_media(fileId=file_id)
+
+            # Назва файлу стане відома лише з метаданих, тому контент
+            # спершу пишеться в тимчасовий файл у цільовому каталозі
+            fd, temp_name = tempfile.mkstemp(dir=target_dir, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    file_metadata = await self._fetch_with_media(
+                        metadata_request, media_request, fh
+                    )
+
+                path = Path(target_dir) / Path(file_metadata['name']).name
+                os.replace(temp_name, path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+
+            logger.info("Завантажено документ %s у файл %s", file_id, path)
+
+            return {
+                'path': path,
+                'name': file_metadata['name'],
+                'mimeType': file_metadata['mimeType']
+            }
+
+        except HttpError as error:
+            logger.error("Помилка при завантаженні документу %s: %s", file_id, error)
             raise Exception(f"Не вдалося завантажити документ: {error}")
 
     async def delete_document(self, file_id: str) -> None:
@@ -205,24 +534,67 @@ class GoogleDriveDocumentStorage:
         Raises:
             Exception: Якщо виникла помилка при видаленні
         """
-        loop = asyncio.get_event_loop()
+        await self.delete_documents([file_id])
+
+    async def delete_documents(self, file_ids: list[str]) -> None:
+        """
+        Видаляє кілька документів з Google Drive batch-запитами.
+
+        Запити групуються по DRIVE_BATCH_SIZE в одному HTTP-запиті.
+
+        Args:
+            file_ids: ID файлів для видалення
+
+        Raises:
+            Exception: Якщо не вдалося видалити хоча б один документ
+        """
+        # ID у batch-запиті мають бути унікальними; порядок зберігається
+        file_ids = list(dict.fromkeys(file_ids))
+        errors: dict[str, Exception] = {}
+
+        def on_response(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                errors[request_id] = exception
 
         try:
             drive_service = self._get_drive_service()
+            pool = self._get_http_pool()
 
-            await loop.run_in_executor(
-                None,
-                lambda: drive_service.files().delete(
-                    fileId=file_id
-                ).execute()
-            )
-
-            logger.info(f"Видалено документ {file_id}")
+            for start in range(0, len(file_ids), DRIVE_BATCH_SIZE):
+                batch = drive_service.new_batch_http_request(callback=on_response)
+                for file_id in file_ids[start:start + DRIVE_BATCH_SIZE]:
+                    batch.add(
+                        drive_service.files().delete(fileId=file_id),
+                        request_id=file_id
+                    )
+                await execute_request(batch, pool)
 
         except HttpError as error:
-            logger.error(f"Помилка при видаленні документу {file_id}: {error}")
+            logger.error("Помилка при видаленні документів: %s", error)
             raise Exception(f"Не вдалося видалити документ: {error}")
 
+        for file_id in file_ids:
+            if file_id not in errors:
+                self._file_cache.pop(file_id, None)
+
+        for file_id, error in errors.items():
+            logger.error("Помилка при видаленні документу %s: %s", file_id, error)
+
+        deleted = len(file_ids) - len(errors)
+        logger.info("Видалено документів: %s", deleted)
+
+        if errors:
+            details = '; '.join(f"{file_id}: {error}" for file_id, error in errors.items())
+            raise Exception(f"Не вдалося видалити документ: {details}")
+
+    async def close(self) -> None:
+        """Закриває HTTP-сесії writer'ів; виклик має відбуватися в loop'і, де вони працювали."""
+        for writer in self._writers.values():
+            await writer.close()
+
     def reset_service(self):
         """Скидає кешований об'єкт сервісу Google Drive."""
         self._drive_service = None
+        self.invalidate_cache()
+        for writer in self._writers.values():
+            writer.reset_service()
@@ -1,8 +1,19 @@
+import io
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 
 
-@dataclass
+_SUMMARY_TEMPLATE = (
+    "Parser: {parser_type}\n"
+    "Query: {element_name}\n"
+    "{text_filter}"
+    "{attr_filter}"
+    "Results found: {count}\n"
+    "Execution time: {ms:.2f}ms\n"
+)
+
+
+@dataclass(slots=True)
 class SearchQuery:
     """
     Represents a search query for XML parsing
@@ -12,27 +23,52 @@ class SearchQuery:
     attribute_name: Optional[str] = None
     attribute_value: Optional[str] = None
     text_contains: Optional[str] = None
+    max_results: Optional[int] = None
+    _element_lc: str = field(init=False, repr=False, compare=False)
+    _text_lc: Optional[str] = field(init=False, repr=False, compare=False)
+    _attr_filter: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute lowercased patterns and filter flags used by the match checks"""
+        self._element_lc = self.element_name.lower()
+        self._text_lc = self.text_contains.lower() if self.text_contains else None
+        self._attr_filter = bool(self.attribute_name and self.attribute_value)
+
+    def has_attribute_filter(self) -> bool:
+        """Check if query filters by attribute value"""
+        return self._attr_filter
+
+    def has_text_filter(self) -> bool:
+        """Check if query filters by text content"""
+        return self._text_lc is not None
 
     def matches_element(self, element_name: str) -> bool:
         """Check if element name matches query"""
-        return self.element_name.lower() == element_name.lower()
-
-    def matches_attribute(self, attributes: Dict[str, str]) -> bool:
-        """Check if attributes match query criteria"""
-        if not self.attribute_name or not self.attribute_value:
+        return self._element_lc == element_name.lower()
+
+    def matches_attribute(self, attributes: Mapping[str, str]) -> bool:
+        """
+        Check if attributes match query criteria
+        Accepts any read-only mapping (dict, lxml attrib, expat attrs)
+        """
+        if not self._attr_filter:
             return True
 
         return attributes.get(self.attribute_name) == self.attribute_value
 
     def matches_text(self, text: str) -> bool:
         """Check if text matches query criteria"""
-        if not self.text_contains:
+        if self._text_lc is None:
             return True
 
-        return self.text_contains.lower() in text.lower()
+        return self._text_lc in text.lower()
+
+    def limit_reached(self, count: int) -> bool:
+        """Check if enough results were collected to stop searching"""
+        return self.max_results is not None and count >= self.max_results
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ParsedElement:
     """
     Represents a parsed XML element
@@ -56,13 +92,13 @@ class ParsedElement:
 
     def __str__(self) -> str:
         """String representation for display"""
+        if not self.attributes:
+            return f"<{self.tag}>"
         attrs_str = ', '.join(f"{k}='{v}'" for k, v in self.attributes.items())
-        if attrs_str:
-            return f"<{self.tag} {attrs_str}>"
-        return f"<{self.tag}>"
+        return f"<{self.tag} {attrs_str}>"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SearchResult:
     """
     Represents search results from XML parsing
@@ -87,38 +123,41 @@ class SearchResult:
 
     def to_summary(self) -> str:
         """Generate a text summary of results"""
-        lines = [
-            f"Parser: {self.parser_type}",
-            f"Query: {self.query.element_name}",
-            f"Results found: {self.get_count()}",
-            f"Execution time: {self.execution_time_ms:.2f}ms",
-            ""
-        ]
-
-        if self.query.attribute_name:
-            lines.insert(2, f"Attribute filter: {self.query.attribute_name}={self.query.attribute_value}")
-
-        if self.query.text_contains:
-            lines.insert(2, f"Text filter: contains '{self.query.text_contains}'")
-
-        return "\n".join(lines)
+        query = self.query
+        return _SUMMARY_TEMPLATE.format_map({
+            'parser_type': self.parser_type,
+            'element_name': query.element_name,
+            'text_filter': (
+                f"Text filter: contains '{query.text_contains}'\n"
+                if query.text_contains else ""
+            ),
+            'attr_filter': (
+                f"Attribute filter: {query.attribute_name}={query.attribute_value}\n"
+                if query.attribute_name else ""
+            ),
+            'count': self.get_count(),
+            'ms': self.execution_time_ms
+        })
 
     def to_detailed_string(self) -> str:
         """Generate detailed string representation of all results"""
         if self.is_empty():
             return self.to_summary() + "\nNo results found."
 
-        lines = [self.to_summary(), "Results:"]
+        buf = io.StringIO()
+        write = buf.write
+        write(self.to_summary())
+        write("\nResults:")
 
         for idx, element in enumerate(self.elements, 1):
-            lines.append(f"\n{idx}. {element}")
+            write(f"\n\n{idx}. {element}")
             if element.path:
-                lines.append(f"   Path: {element.path}")
-            if element.attributes:
-                for key, value in element.attributes.items():
-                    lines.append(f"   @{key}: {value}")
-            if element.text and element.text.strip():
+                write(f"\n   Path: {element.path}")
+            for key, value in element.attributes.items():
+                write(f"\n   @{key}: {value}")
+            if element.text:
                 text_preview = element.text.strip()[:100]
-                lines.append(f"   Text: {text_preview}...")
+                if text_preview:
+                    write(f"\n   Text: {text_preview}...")
 
-        return "\n".join(lines)
+        return buf.getvalue()
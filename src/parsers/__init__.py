@@ -3,13 +3,14 @@ Parsers package implementing Strategy pattern
 Each parser is a different strategy for parsing XML
 """
 
-from .base_parser import IXMLParser
+from .base_parser import IXMLParser, ParseCancelledError
 from .sax_parser import SAXParserStrategy
 from .dom_parser import DOMParserStrategy
 from .elementtree_parser import ElementTreeParserStrategy
 
 __all__ = [
     'IXMLParser',
+    'ParseCancelledError',
     'SAXParserStrategy',
     'DOMParserStrategy',
     'ElementTreeParserStrategy'
@@ -1,24 +1,76 @@
+import multiprocessing
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Set
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Optional, Set
 from pathlib import Path
+from lxml import etree # type: ignore
 
 from src.models.search_models import SearchQuery, SearchResult
 
 
+# lxml parser options shared by tree-based strategies: skip xml:id bookkeeping,
+# never fetch or expand external entities, allow very large/deep documents and
+# drop whitespace-only text nodes (search results strip text anyway)
+LXML_PARSE_OPTIONS = {
+    'collect_ids': False,
+    'resolve_entities': False,
+    'no_network': True,
+    'huge_tree': True,
+    'remove_blank_text': True,
+}
+
+# How many elements a strategy processes between cancellation checks
+CANCEL_CHECK_INTERVAL = 4096
+
+_thread_state = threading.local()
+
+
+def lxml_parser() -> etree.XMLParser:
+    """
+    Return the tuned lxml parser for the current thread
+    A parser instance serializes concurrent parses, so each thread gets its own
+    """
+    parser = getattr(_thread_state, 'parser', None)
+    if parser is None:
+        parser = _thread_state.parser = etree.XMLParser(**LXML_PARSE_OPTIONS)
+    return parser
+
+
+class ParseCancelledError(Exception):
+    """Raised when a parse is abandoned because its cancel event was set"""
+
+
 class IXMLParser(ABC):
     """
     Interface for XML parsing strategies
     Responsibility: Define contract for all XML parsers
     """
 
+    # True if parsing runs mostly in C with the GIL released (lxml),
+    # so parse_many can use threads instead of processes
+    releases_gil: bool = False
+
+    # True if attributes are keyed by their name as written ("p:local")
+    # rather than lxml's "{uri}local"; selects the metadata index form
+    qualified_attribute_names: bool = False
+
     @abstractmethod
-    def parse(self, file_path: Path, query: SearchQuery) -> SearchResult:
+    def parse(
+        self,
+        file_path: Path,
+        query: SearchQuery,
+        cancel_event: Optional[threading.Event] = None
+    ) -> SearchResult:
         """
         Parse XML file and search for elements matching query
 
         Args:
             file_path: Path to XML file
             query: Search query parameters
+            cancel_event: Optional event polled while parsing; once set,
+                parsing stops with ParseCancelledError
 
         Returns:
             SearchResult with matched elements
@@ -26,6 +78,7 @@ class IXMLParser(ABC):
         Raises:
             FileNotFoundError: If XML file doesn't exist
             ValueError: If XML is malformed
+            ParseCancelledError: If cancel_event was set
         """
         pass
 
@@ -70,6 +123,49 @@ class IXMLParser(ABC):
         """
         pass
 
+    def parse_many(
+        self,
+        file_paths: Iterable[Path],
+        query: SearchQuery,
+        max_workers: Optional[int] = None
+    ) -> list[SearchResult]:
+        """
+        Parse several XML files with the same query in parallel
+
+        Uses a thread pool for strategies that release the GIL and a process
+        pool otherwise. Results are returned in the order of file_paths.
+
+        Args:
+            file_paths: Paths to XML files
+            query: Search query parameters
+            max_workers: Worker count (default: number of CPUs)
+
+        Returns:
+            List of SearchResult, one per file
+
+        Raises:
+            FileNotFoundError: If an XML file doesn't exist
+            ValueError: If an XML file is malformed
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+
+        executor: Executor
+        if self.releases_gil:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            # spawn: forking a process that runs a Qt event loop is unsafe
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+
+        with executor:
+            return list(executor.map(self.parse, file_paths, [query] * len(file_paths)))
+
     def validate_file(self, file_path: Path) -> None:
         """
         Validate that file exists and is accessible
@@ -1,25 +1,34 @@
+import threading
 import time
 from pathlib import Path
-from typing import Set
-from xml.dom import minidom
-from xml.dom.minidom import Element
+from typing import Optional, Set
+from lxml import etree # type: ignore
 
 from src.models.search_models import SearchQuery, SearchResult, ParsedElement
 from src.utils import Logger
-from .base_parser import IXMLParser
+from .base_parser import (
+    IXMLParser, ParseCancelledError, lxml_parser, CANCEL_CHECK_INTERVAL
+)
 
 
 class DOMParserStrategy(IXMLParser):
     """
     DOM Parser implementation
-    Responsibility: Implement XML parsing using DOM API
+    Responsibility: Implement XML parsing using DOM API (lxml tree)
     """
 
+    releases_gil = True
+
     def get_parser_name(self) -> str:
         """Return parser name"""
         return "DOM Parser"
 
-    def parse(self, file_path: Path, query: SearchQuery) -> SearchResult:
+    def parse(
+        self,
+        file_path: Path,
+        query: SearchQuery,
+        cancel_event: Optional[threading.Event] = None
+    ) -> SearchResult:
         """Parse XML file using DOM"""
         self.validate_file(file_path)
 
@@ -27,13 +36,13 @@ class DOMParserStrategy(IXMLParser):
 
         try:
             # Parse XML into DOM tree
-            dom = minidom.parse(str(file_path))
+            dom = etree.parse(str(file_path), parser=lxml_parser())
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
         # Search for matching elements
         results = []
-        self._search_elements(dom.documentElement, query, results, [])
+        self._search_elements(dom.getroot(), query, results, cancel_event)
 
         execution_time = (time.time() - start_time) * 1000
 
@@ -48,110 +57,137 @@ class DOMParserStrategy(IXMLParser):
         # Log filtering operation
         logger = Logger()
         logger.log_filtering(
-            f'Парсер: {self.get_parser_name()}, '
-            f'Файл: {file_path.name}, '
-            f'Елемент: {query.element_name}, '
-            f'Знайдено: {len(results)} елементів, '
-            f'Час виконання: {execution_time:.2f} мс'
+            'Парсер: %s, Файл: %s, Елемент: %s, '
+            'Знайдено: %d елементів, Час виконання: %.2f мс',
+            self.get_parser_name(),
+            file_path.name,
+            query.element_name,
+            len(results),
+            execution_time
         )
 
         return result
 
     def _search_elements(
         self,
-        node: Element,
+        root: etree._Element,
         query: SearchQuery,
         results: list,
-        path: list
+        cancel_event: Optional[threading.Event] = None
     ) -> None:
         """
-        Recursively search DOM tree for matching elements
+        Search DOM tree for matching elements
         Responsibility: Traverse DOM tree and collect matches
         """
-        if node.nodeType != node.ELEMENT_NODE:
-            return
-
-        # Update path
-        current_path = path + [node.nodeName]
-
-        # Check if element matches query
-        if query.matches_element(node.nodeName):
-            # Extract attributes
-            attributes = {}
-            if node.attributes:
-                for i in range(node.attributes.length):
-                    attr = node.attributes.item(i)
-                    attributes[attr.name] = attr.value
-
-            # Check attribute filter
-            if query.matches_attribute(attributes):
-                # Extract text content
-                text = self._get_element_text(node)
-
-                # Check text filter
-                if query.matches_text(text):
-                    element = ParsedElement(
-                        tag=node.nodeName,
-                        attributes=attributes,
-                        text=text,
-                        path="/".join(current_path)
-                    )
-                    results.append(element)
-
-        # Recursively search child elements
-        for child in node.childNodes:
-            if child.nodeType == child.ELEMENT_NODE:
-                self._search_elements(child, query, results, current_path)
-
-    def _get_element_text(self, node: Element) -> str:
+        # Qualified tag -> local name if it matches the query, else None.
+        # Evaluated once per distinct tag instead of once per node.
+        matching_tags: dict[str, str | None] = {}
+        # Per-search string pool: attribute names and paths repeat across
+        # matches, so equal strings share one object
+        share = {}.setdefault
+
+        # iter() walks the tree in libxml2; comments and PIs are skipped
+        for count, node in enumerate(root.iter(etree.Element)):
+            if (
+                cancel_event is not None
+                and count % CANCEL_CHECK_INTERVAL == 0
+                and cancel_event.is_set()
+            ):
+                raise ParseCancelledError()
+
+            qualified = node.tag
+            if qualified not in matching_tags:
+                local_name = etree.QName(qualified).localname
+                matching_tags[qualified] = (
+                    local_name if query.matches_element(local_name) else None
+                )
+
+            # Check if element matches query
+            tag = matching_tags[qualified]
+            if tag is None:
+                continue
+
+            # Check attribute filter directly on the lxml attrib mapping
+            if not query.matches_attribute(node.attrib):
+                continue
+
+            # Extract text content
+            text = self._get_element_text(node)
+
+            # Check text filter; copy attributes only for recorded matches
+            if query.matches_text(text):
+                path = self._get_element_path(node, tag)
+                element = ParsedElement(
+                    tag=tag,
+                    attributes={share(k, k): v for k, v in node.attrib.items()},
+                    text=text,
+                    path=share(path, path)
+                )
+                results.append(element)
+
+                # Stop walking once the requested number of matches is found
+                if query.limit_reached(len(results)):
+                    break
+
+    def _get_element_text(self, node: etree._Element) -> str:
         """
         Extract text content from element
         Responsibility: Get direct text content (not from children)
         """
-        text_parts = []
-        for child in node.childNodes:
-            if child.nodeType == child.TEXT_NODE:
-                text_parts.append(child.data)
+        text_parts = [node.text or ""]
+        for child in node:
+            text_parts.append(child.tail or "")
         return "".join(text_parts).strip()
 
+    def _get_element_path(self, node: etree._Element, tag: str) -> str:
+        """
+        Build slash-separated path of local names from root to element
+        Responsibility: Compute path only for matched elements
+        """
+        names = [etree.QName(ancestor).localname for ancestor in node.iterancestors()]
+        names.reverse()
+        names.append(tag)
+        return "/".join(names)
+
     def get_available_attributes(self, file_path: Path, element_name: str) -> Set[str]:
         """Get all attribute names for given element type"""
         self.validate_file(file_path)
 
         try:
-            dom = minidom.parse(str(file_path))
+            dom = etree.parse(str(file_path), parser=lxml_parser())
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
         attributes = set()
-        self._collect_attributes(dom.documentElement, element_name, attributes)
+        self._collect_attributes(dom.getroot(), element_name.lower(), attributes)
 
         return attributes
 
     def _collect_attributes(
         self,
-        node: Element,
-        element_name: str,
+        root: etree._Element,
+        target: str,
         attributes: Set[str]
     ) -> None:
         """
-        Recursively collect attribute names from matching elements
+        Collect attribute names from matching elements
         Responsibility: Traverse DOM and collect attribute names
         """
-        if node.nodeType != node.ELEMENT_NODE:
-            return
-
-        # Check if element matches
-        if node.nodeName.lower() == element_name.lower():
-            if node.attributes:
-                for i in range(node.attributes.length):
-                    attr = node.attributes.item(i)
-                    attributes.add(attr.name)
+        # Qualified tag -> whether it matches, so each distinct tag is
+        # namespace-stripped and lower-cased only once
+        matches: dict[str, bool] = {}
+
+        for node in root.iter(etree.Element):
+            qualified = node.tag
+            matched = matches.get(qualified)
+            if matched is None:
+                matched = matches[qualified] = (
+                    qualified.rpartition('}')[2].lower() == target
+                )
 
-        # Recursively search children
-        for child in node.childNodes:
-            if child.nodeType == child.ELEMENT_NODE:
-                self._collect_attributes(child, element_name, attributes)
+            # Check if element matches
+            if matched:
+                attributes.update(node.attrib.keys())
 
     def get_attribute_values(
         self,
@@ -163,14 +199,14 @@ class DOMParserStrategy(IXMLParser):
         self.validate_file(file_path)
 
         try:
-            dom = minidom.parse(str(file_path))
+            dom = etree.parse(str(file_path), parser=lxml_parser())
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
         values = set()
         self._collect_attribute_values(
-            dom.documentElement,
-            element_name,
+            dom.getroot(),
+            element_name.lower(),
             attribute_name,
             values
         )
@@ -179,29 +215,28 @@ class DOMParserStrategy(IXMLParser):
 
     def _collect_attribute_values(
         self,
-        node: Element,
-        element_name: str,
+        root: etree._Element,
+        target: str,
         attribute_name: str,
         values: Set[str]
     ) -> None:
         """
-        Recursively collect attribute values from matching elements
+        Collect attribute values from matching elements
         Responsibility: Traverse DOM and collect attribute values
         """
-        if node.nodeType != node.ELEMENT_NODE:
-            return
-
-        # Check if element matches
-        if node.nodeName.lower() == element_name.lower():
-            if node.hasAttribute(attribute_name):
-                values.add(node.getAttribute(attribute_name))
-
-        # Recursively search children
-        for child in node.childNodes:
-            if child.nodeType == child.ELEMENT_NODE:
-                self._collect_attribute_values(
-                    child,
-                    element_name,
-                    attribute_name,
-                    values
+        # Qualified tag -> whether it matches (see _collect_attributes)
+        matches: dict[str, bool] = {}
+
+        for node in root.iter(etree.Element):
+            qualified = node.tag
+            matched = matches.get(qualified)
+            if matched is None:
+                matched = matches[qualified] = (
+                    qualified.rpartition('}')[2].lower() == target
                 )
+
+            # Check if element matches
+            if matched:
+                value = node.get(attribute_name)
+                if value is not None:
+                    values.add(value)
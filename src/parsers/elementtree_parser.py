@@ -1,40 +1,49 @@
+import threading
 import time
 from pathlib import Path
-from typing import Set
-import xml.etree.ElementTree as ET
+from typing import Iterator, Optional, Set
+from lxml import etree # type: ignore
 
 from src.models.search_models import SearchQuery, SearchResult, ParsedElement
 from src.utils import Logger
-from .base_parser import IXMLParser
+from .base_parser import (
+    IXMLParser, ParseCancelledError, LXML_PARSE_OPTIONS, lxml_parser,
+    CANCEL_CHECK_INTERVAL
+)
 
 
 class ElementTreeParserStrategy(IXMLParser):
     """
     ElementTree Parser implementation (LINQ to XML equivalent)
-    Responsibility: Implement XML parsing using ElementTree API
+    Responsibility: Implement XML parsing using ElementTree API (lxml iterparse)
     """
 
+    releases_gil = True
+
     def get_parser_name(self) -> str:
         """Return parser name"""
         return "ElementTree Parser (LINQ to XML)"
 
-    def parse(self, file_path: Path, query: SearchQuery) -> SearchResult:
+    def parse(
+        self,
+        file_path: Path,
+        query: SearchQuery,
+        cancel_event: Optional[threading.Event] = None
+    ) -> SearchResult:
         """Parse XML file using ElementTree"""
         self.validate_file(file_path)
 
         start_time = time.time()
 
+        # Search for matching elements using LINQ-like approach
+        results = []
         try:
-            # Parse XML
-            tree = ET.parse(str(file_path))
-            root = tree.getroot()
+            self._search_elements(file_path, query, results, cancel_event)
+        except ParseCancelledError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
-        # Search for matching elements using LINQ-like approach
-        results = []
-        self._search_elements(root, query, results, [])
-
         execution_time = (time.time() - start_time) * 1000
 
         # Build result
@@ -48,65 +57,136 @@ class ElementTreeParserStrategy(IXMLParser):
         # Log filtering operation
         logger = Logger()
         logger.log_filtering(
-            f'Парсер: {self.get_parser_name()}, '
-            f'Файл: {file_path.name}, '
-            f'Елемент: {query.element_name}, '
-            f'Знайдено: {len(results)} елементів, '
-            f'Час виконання: {execution_time:.2f} мс'
+            'Парсер: %s, Файл: %s, Елемент: %s, '
+            'Знайдено: %d елементів, Час виконання: %.2f мс',
+            self.get_parser_name(),
+            file_path.name,
+            query.element_name,
+            len(results),
+            execution_time
         )
 
         return result
 
+    def _iterparse(
+        self,
+        file_path: Path,
+        events: tuple[str, ...]
+    ) -> Iterator[tuple[str, etree._Element]]:
+        """
+        Stream (event, element) pairs and discard each subtree once it ends
+        Responsibility: Keep memory bounded by the current path, not the file
+        """
+        for event, element in etree.iterparse(
+            str(file_path), events=events, **LXML_PARSE_OPTIONS
+        ):
+            yield event, element
+
+            if event == 'end':
+                # Free the finished subtree and already processed siblings
+                element.clear()
+                # The root has no parent; its prolog PIs/comments stay
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
     def _search_elements(
         self,
-        element: ET.Element,
+        file_path: Path,
         query: SearchQuery,
         results: list,
-        path: list
+        cancel_event: Optional[threading.Event] = None
     ) -> None:
         """
-        Recursively search ElementTree for matching elements
-        Uses LINQ-like approach with generators and comprehensions
+        Search the streamed document for matching elements
+        Uses LINQ-like approach over start/end events instead of recursion
         Responsibility: Traverse tree and collect matches
         """
-        # Remove namespace from tag if present
-        tag = self._remove_namespace(element.tag)
-
-        # Update path
-        current_path = path + [tag]
-
-        # Check if element matches query (LINQ-like filter)
-        if query.matches_element(tag):
-            # Extract attributes
-            attributes = dict(element.attrib)
-
-            # Check attribute filter (LINQ-like where clause)
-            if query.matches_attribute(attributes):
-                # Extract text content
-                text = element.text or ""
-
-                # Check text filter (LINQ-like contains)
-                if query.matches_text(text):
-                    parsed_element = ParsedElement(
+        path: list[str] = []
+        # Slot in results of each open element, or -1 if it does not match.
+        # Matches are recorded at their start tag so results keep document
+        # order; the text filter is applied once the element ends.
+        slots: list[int] = []
+        pending = 0
+        confirmed = 0
+        # Qualified tag -> local name, and local name -> whether it matches
+        # the query; a document has few distinct tags
+        local_names: dict[str, str] = {}
+        element_matches: dict[str, bool] = {}
+        # Per-search string pool: attribute names and paths repeat across
+        # matches, so equal strings share one object
+        share = {}.setdefault
+
+        for count, (event, element) in enumerate(
+            self._iterparse(file_path, ('start', 'end'))
+        ):
+            if (
+                cancel_event is not None
+                and count % CANCEL_CHECK_INTERVAL == 0
+                and cancel_event.is_set()
+            ):
+                raise ParseCancelledError()
+
+            if event == 'start':
+                # Remove namespace from tag if present and descend
+                qualified = element.tag
+                tag = local_names.get(qualified)
+                if tag is None:
+                    tag = local_names[qualified] = self._remove_namespace(qualified)
+                path.append(tag)
+
+                matched = element_matches.get(tag)
+                if matched is None:
+                    matched = element_matches[tag] = query.matches_element(tag)
+
+                # Check element and attribute filter (LINQ-like where clause);
+                # attributes are complete at the start tag
+                if matched and query.matches_attribute(element.attrib):
+                    # Copy attributes only for candidate matches
+                    joined_path = "/".join(path)
+                    slots.append(len(results))
+                    results.append(ParsedElement(
                         tag=tag,
-                        attributes=attributes,
-                        text=text.strip(),
-                        path="/".join(current_path)
-                    )
-                    results.append(parsed_element)
-
-        # Recursively search children (LINQ-like SelectMany)
-        for child in element:
-            self._search_elements(child, query, results, current_path)
+                        attributes={share(k, k): v for k, v in element.attrib.items()},
+                        path=share(joined_path, joined_path)
+                    ))
+                    pending += 1
+                else:
+                    slots.append(-1)
+                continue
+
+            slot = slots.pop()
+            path.pop()
+            if slot < 0:
+                continue
+
+            # Extract text content and check text filter (LINQ-like contains)
+            pending -= 1
+            text = element.text or ""
+            if query.matches_text(text):
+                results[slot].text = text.strip()
+                confirmed += 1
+            else:
+                results[slot] = None
+
+            # Stop reading the file once enough matches are found and no
+            # earlier candidate (an open ancestor) is still undecided
+            if pending == 0 and query.limit_reached(confirmed):
+                break
+
+        # Drop candidates rejected by the text filter, keeping document order
+        results[:] = [element for element in results if element is not None]
+        if query.max_results is not None:
+            del results[query.max_results:]
 
     def _remove_namespace(self, tag: str) -> str:
         """
         Remove namespace from tag name
         Responsibility: Clean tag names for comparison
         """
-        if '}' in tag:
-            return tag.split('}', 1)[1]
-        return tag
+        # Tail after the last '}' is the whole tag when there is no namespace
+        return tag.rpartition('}')[2]
 
     def get_available_attributes(self, file_path: Path, element_name: str) -> Set[str]:
         """
@@ -115,37 +195,40 @@ class ElementTreeParserStrategy(IXMLParser):
         """
         self.validate_file(file_path)
 
+        # LINQ-like query: Select all attributes from matching elements
+        attributes = set()
         try:
-            tree = ET.parse(str(file_path))
-            root = tree.getroot()
+            self._collect_attributes(file_path, element_name.lower(), attributes)
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
-        # LINQ-like query: Select all attributes from matching elements
-        attributes = set()
-        self._collect_attributes(root, element_name, attributes)
-
         return attributes
 
     def _collect_attributes(
         self,
-        element: ET.Element,
-        element_name: str,
+        file_path: Path,
+        target: str,
         attributes: Set[str]
     ) -> None:
         """
-        Recursively collect attribute names
-        Uses LINQ-like aggregation
+        Collect attribute names across the whole document
+        Uses LINQ-like aggregation over streamed elements
         """
-        tag = self._remove_namespace(element.tag)
-
-        if tag.lower() == element_name.lower():
-            # Add all attribute names from this element
-            attributes.update(element.attrib.keys())
-
-        # Recursively search children
-        for child in element:
-            self._collect_attributes(child, element_name, attributes)
+        # Qualified tag -> whether it matches, so each distinct tag is
+        # namespace-stripped and lower-cased only once
+        matches: dict[str, bool] = {}
+
+        for _, element in self._iterparse(file_path, ('end',)):
+            qualified = element.tag
+            matched = matches.get(qualified)
+            if matched is None:
+                matched = matches[qualified] = (
+                    self._remove_namespace(qualified).lower() == target
+                )
+
+            if matched:
+                # Add all attribute names from this element
+                attributes.update(element.attrib.keys())
 
     def get_attribute_values(
         self,
@@ -159,47 +242,45 @@ class ElementTreeParserStrategy(IXMLParser):
         """
         self.validate_file(file_path)
 
+        # LINQ-like query: Select attribute values from matching elements
+        values = set()
         try:
-            tree = ET.parse(str(file_path))
-            root = tree.getroot()
+            self._collect_attribute_values(file_path, element_name.lower(), attribute_name, values)
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
-        # LINQ-like query: Select attribute values from matching elements
-        values = set()
-        self._collect_attribute_values(root, element_name, attribute_name, values)
-
         return values
 
     def _collect_attribute_values(
         self,
-        element: ET.Element,
-        element_name: str,
+        file_path: Path,
+        target: str,
         attribute_name: str,
         values: Set[str]
     ) -> None:
         """
-        Recursively collect attribute values
-        Uses LINQ-like Where().Select() pattern
+        Collect attribute values across the whole document
+        Uses LINQ-like Where().Select() pattern over streamed elements
         """
-        tag = self._remove_namespace(element.tag)
-
-        # Where clause: filter by element name
-        if tag.lower() == element_name.lower():
-            # Select clause: get attribute value if exists
-            if attribute_name in element.attrib:
-                values.add(element.attrib[attribute_name])
-
-        # Recursively search children (SelectMany)
-        for child in element:
-            self._collect_attribute_values(
-                child,
-                element_name,
-                attribute_name,
-                values
-            )
-
-    def get_elements_by_xpath(self, file_path: Path, xpath: str) -> list[ET.Element]:
+        # Qualified tag -> whether it matches (see _collect_attributes)
+        matches: dict[str, bool] = {}
+
+        for _, element in self._iterparse(file_path, ('end',)):
+            qualified = element.tag
+            matched = matches.get(qualified)
+            if matched is None:
+                matched = matches[qualified] = (
+                    self._remove_namespace(qualified).lower() == target
+                )
+
+            # Where clause: filter by element name
+            if matched:
+                # Select clause: get attribute value if exists
+                value = element.get(attribute_name)
+                if value is not None:
+                    values.add(value)
+
+    def get_elements_by_xpath(self, file_path: Path, xpath: str) -> list[etree._Element]:
         """
         Additional LINQ-to-XML feature: XPath queries
         Responsibility: Provide XPath-based element selection
@@ -207,9 +288,13 @@ class ElementTreeParserStrategy(IXMLParser):
         self.validate_file(file_path)
 
         try:
-            tree = ET.parse(str(file_path))
+            tree = etree.parse(str(file_path), parser=lxml_parser())
             root = tree.getroot()
         except Exception as e:
             raise ValueError(f"Failed to parse XML: {str(e)}")
 
-        return root.findall(xpath)
+        # ElementPath accepts "{uri}local" steps; lxml caches compiled paths
+        try:
+            return root.findall(xpath)
+        except SyntaxError as e:
+            raise ValueError(f"Invalid XPath expression: {str(e)}")
@@ -1,80 +1,114 @@
+import mmap
+import threading
 import time
 from pathlib import Path
-from typing import Set
-from xml.sax import make_parser, ContentHandler
-from xml.sax.handler import feature_namespaces
+from typing import Optional, Set
+from xml.parsers import expat
 
 from src.models.search_models import SearchQuery, SearchResult, ParsedElement
 from src.utils import Logger
-from .base_parser        import IXMLParser
+from .base_parser import IXMLParser, ParseCancelledError
 
 
-class SAXSearchHandler(ContentHandler):
+# Files at least this large are mapped into memory and fed to expat in one
+# call; smaller ones are cheaper to read through ParseFile
+MMAP_THRESHOLD = 1024 * 1024
+
+# Slice of a mapped file fed to expat between cancellation checks
+CANCEL_CHUNK_SIZE = 256 * 1024
+
+
+class _StopParsing(Exception):
+    """Raised from a handler callback to end parsing early"""
+
+
+class SAXSearchHandler:
     """
-    SAX Content Handler for searching elements
+    SAX event handler for searching elements
     Responsibility: Handle SAX parsing events and collect matching elements
     """
 
     def __init__(self, query: SearchQuery):
-        super().__init__()
         self.query = query
         self.results: list[ParsedElement] = []
         self.current_path: list[str] = []
-        self.current_text: str = ""
-        self.current_element: ParsedElement | None = None
+        self.current_text: list[str] = []
+        # (tag, attributes) of the element being tracked until its end tag
+        self.current_element: tuple[str, dict[str, str]] | None = None
+        # Equal paths of different matches share one string object
+        # (expat already interns element and attribute names)
+        self._share = {}.setdefault
+
+    def bind(self, parser) -> None:
+        """Register handler callbacks on an expat parser"""
+        parser.StartElementHandler = self.startElement
+        parser.EndElementHandler = self.endElement
+        parser.CharacterDataHandler = self.characters
 
     def startElement(self, name, attrs):
         """Handle start of element"""
         self.current_path.append(name)
-        self.current_text = ""
+        self.current_text.clear()
 
         # Check if this element matches query
         if self.query.matches_element(name):
-            attributes = dict(attrs.items())
+            # expat passes a fresh {name: value} dict per element; keep it as-is
+            attributes = attrs
 
             # Check attribute filter
             if self.query.matches_attribute(attributes):
-                self.current_element = ParsedElement(
-                    tag=name,
-                    attributes=attributes,
-                    path="/".join(self.current_path)
-                )
+                self.current_element = (name, attributes)
 
     def endElement(self, name):
         """Handle end of element"""
         # If we were tracking this element, check text filter and add to results
-        if self.current_element and self.current_element.tag == name:
-            self.current_element.text = self.current_text.strip()
+        if self.current_element is not None and self.current_element[0] == name:
+            text = "".join(self.current_text).strip()
+
+            if self.query.matches_text(text):
+                # Path is unchanged until the pop below; build it only for matches
+                path = "/".join(self.current_path)
+                self.results.append(ParsedElement(
+                    tag=name,
+                    attributes=self.current_element[1],
+                    text=text,
+                    path=self._share(path, path)
+                ))
 
-            if self.query.matches_text(self.current_element.text):
-                self.results.append(self.current_element)
+                # Abort parsing once the requested number of matches is found
+                if self.query.limit_reached(len(self.results)):
+                    raise _StopParsing()
 
             self.current_element = None
 
         self.current_path.pop()
-        self.current_text = ""
+        self.current_text.clear()
 
     def characters(self, content):
         """Handle character data"""
-        self.current_text += content
+        self.current_text.append(content)
 
 
-class SAXAttributeCollector(ContentHandler):
+class SAXAttributeCollector:
     """
     SAX Handler for collecting attribute information
     Responsibility: Extract attribute names and values from XML
     """
 
     def __init__(self, element_name: str, attribute_name: str | None = None):
-        super().__init__()
         self.element_name = element_name
+        self._target = element_name.lower()
         self.attribute_name = attribute_name
         self.attributes: Set[str] = set()
         self.values: Set[str] = set()
 
+    def bind(self, parser) -> None:
+        """Register handler callbacks on an expat parser"""
+        parser.StartElementHandler = self.startElement
+
     def startElement(self, name, attrs):
         """Collect attributes from matching elements"""
-        if name.lower() == self.element_name.lower():
+        if name.lower() == self._target:
             if self.attribute_name:
                 # Collecting values for specific attribute
                 if self.attribute_name in attrs:
@@ -90,29 +124,78 @@ class SAXParserStrategy(IXMLParser):
     Responsibility: Implement XML parsing using SAX API
     """
 
+    # expat runs without namespace processing, so attributes keep prefixes
+    qualified_attribute_names = True
+
     def get_parser_name(self) -> str:
         """Return parser name"""
         return "SAX Parser"
 
-    def parse(self, file_path: Path, query: SearchQuery) -> SearchResult:
+    def _run(
+        self,
+        file_path: Path,
+        handler,
+        cancel_event: Optional[threading.Event] = None
+    ) -> None:
+        """
+        Stream file through expat with handler callbacks attached
+        Responsibility: Drive event-based parsing without the xml.sax wrapper
+        """
+        # Create parser (no namespace processing, as before)
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        handler.bind(parser)
+
+        try:
+            with open(file_path, 'rb') as f:
+                # ParseFile reads in 2 KiB chunks through Python; a mapping
+                # lets expat consume the page cache directly
+                if file_path.stat().st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if cancel_event is None:
+                            parser.Parse(mm, True)
+                        else:
+                            self._parse_cancellable(parser, mm, cancel_event)
+                else:
+                    parser.ParseFile(f)
+        except _StopParsing:
+            pass
+        except ParseCancelledError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to parse XML: {str(e)}")
+
+    def _parse_cancellable(
+        self,
+        parser,
+        mm: mmap.mmap,
+        cancel_event: threading.Event
+    ) -> None:
+        """
+        Feed mapped file to expat in slices, checking cancel_event in between
+        Responsibility: Allow long SAX parses to be abandoned cooperatively
+        """
+        with memoryview(mm) as view:
+            for offset in range(0, len(view), CANCEL_CHUNK_SIZE):
+                if cancel_event.is_set():
+                    raise ParseCancelledError()
+                parser.Parse(view[offset:offset + CANCEL_CHUNK_SIZE], False)
+        parser.Parse(b'', True)
+
+    def parse(
+        self,
+        file_path: Path,
+        query: SearchQuery,
+        cancel_event: Optional[threading.Event] = None
+    ) -> SearchResult:
         """Parse XML file using SAX"""
         self.validate_file(file_path)
 
         start_time = time.time()
 
-        # Create parser
-        parser = make_parser()
-        parser.setFeature(feature_namespaces, False)
-
-        # Create and set handler
+        # Create handler and parse file
         handler = SAXSearchHandler(query)
-        parser.setContentHandler(handler)
-
-        # Parse file
-        try:
-            parser.parse(str(file_path))
-        except Exception as e:
-            raise ValueError(f"Failed to parse XML: {str(e)}")
+        self._run(file_path, handler, cancel_event)
 
         execution_time = (time.time() - start_time) * 1000
 
@@ -127,11 +210,13 @@ class SAXParserStrategy(IXMLParser):
         # Log filtering operation
         logger = Logger()
         logger.log_filtering(
-            f'Парсер: {self.get_parser_name()}, '
-            f'Файл: {file_path.name}, '
-            f'Елемент: {query.element_name}, '
-            f'Знайдено: {len(handler.results)} елементів, '
-            f'Час виконання: {execution_time:.2f} мс'
+            'Парсер: %s, Файл: %s, Елемент: %s, '
+            'Знайдено: %d елементів, Час виконання: %.2f мс',
+            self.get_parser_name(),
+            file_path.name,
+            query.element_name,
+            len(handler.results),
+            execution_time
         )
 
         return result
@@ -140,16 +225,8 @@ class SAXParserStrategy(IXMLParser):
         """Get all attribute names for given element type"""
         self.validate_file(file_path)
 
-        parser = make_parser()
-        parser.setFeature(feature_namespaces, False)
-
         handler = SAXAttributeCollector(element_name)
-        parser.setContentHandler(handler)
-
-        try:
-            parser.parse(str(file_path))
-        except Exception as e:
-            raise ValueError(f"Failed to parse XML: {str(e)}")
+        self._run(file_path, handler)
 
         return handler.attributes
 
@@ -157,15 +234,7 @@ class SAXParserStrategy(IXMLParser):
         """Get all values for specific attribute"""
         self.validate_file(file_path)
 
-        parser = make_parser()
-        parser.setFeature(feature_namespaces, False)
-
         handler = SAXAttributeCollector(element_name, attribute_name)
-        parser.setContentHandler(handler)
-
-        try:
-            parser.parse(str(file_path))
-        except Exception as e:
-            raise ValueError(f"Failed to parse XML: {str(e)}")
+        self._run(file_path, handler)
 
         return handler.values
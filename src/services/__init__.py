@@ -4,5 +4,6 @@ Contains business logic separated from parsers and UI
 """
 
 from .xml_transformer import XMLTransformer
+from .xml_metadata import XMLMetadataIndex
 
-__all__ = ['XMLTransformer']
+__all__ = ['XMLTransformer', 'XMLMetadataIndex']
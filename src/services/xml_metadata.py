@@ -0,0 +1,167 @@
+import mmap
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from xml.parsers import expat
+
+from src.parsers.sax_parser import MMAP_THRESHOLD
+
+
+class XMLMetadataIndex:
+    """
+    In-memory index of element names, attribute names and attribute values
+    Responsibility: Serve search-form lookups without re-parsing the XML file
+    """
+
+    def __init__(self) -> None:
+        self._element_names: Set[str] = set()
+        # Lower-cased element name -> attribute name -> attribute values,
+        # with namespaced attributes named "{uri}local" as lxml reports them
+        self._attributes: Dict[str, Dict[str, Set[str]]] = {}
+        # Same, with attributes named as written ("p:local"), including
+        # xmlns declarations, as a non-namespace-aware parser reports them
+        self._qualified_attributes: Dict[str, Dict[str, Set[str]]] = {}
+        # (lower-cased element, attribute or None, qualified) -> sorted combo
+        # items; the index does not change after the scan, so each list is
+        # sorted once
+        self._sorted: Dict[Tuple[Optional[str], Optional[str], bool], List[str]] = {}
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> 'XMLMetadataIndex':
+        """
+        Build index with a single streaming pass over the XML file
+
+        Raises:
+            ValueError: If XML is malformed
+        """
+        index = cls()
+
+        # Report names as "uri}local}prefix" so both the "{uri}local" form
+        # of lxml-based strategies and the "prefix:local" form of SAX can be
+        # derived from one pass
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.namespace_prefixes = True
+
+        # Reported name -> attribute map of its element type, so each
+        # distinct tag is stripped, lower-cased and recorded only once
+        known_by_tag: Dict[str, Dict[str, Set[str]]] = {}
+        # Lower-cased element name -> reported attribute name -> values
+        raw_by_name: Dict[str, Dict[str, Set[str]]] = {}
+        # Lower-cased element name -> xmlns declaration -> namespace URIs
+        declared_by_name: Dict[str, Dict[str, Set[str]]] = {}
+        # Declarations reported before the start tag that carries them
+        pending_declarations: List[Tuple[str, str]] = []
+        element_names = index._element_names
+
+        def start_namespace(prefix: Optional[str], uri: Optional[str]) -> None:
+            pending_declarations.append(
+                ('xmlns:' + prefix if prefix else 'xmlns', uri or '')
+            )
+
+        def start_element(qualified: str, attrs: Dict[str, str]) -> None:
+            known = known_by_tag.get(qualified)
+            if known is None:
+                parts = qualified.split('}')
+                name = sys.intern(parts[1] if len(parts) > 1 else parts[0])
+                element_names.add(name)
+                known = known_by_tag[qualified] = raw_by_name.setdefault(
+                    name.lower(), {}
+                )
+
+            for attr_name, value in attrs.items():
+                values = known.get(attr_name)
+                if values is None:
+                    values = known[attr_name] = set()
+                values.add(value)
+
+            if pending_declarations:
+                parts = qualified.split('}')
+                declared = declared_by_name.setdefault(
+                    (parts[1] if len(parts) > 1 else parts[0]).lower(), {}
+                )
+                for declaration, uri in pending_declarations:
+                    declared.setdefault(declaration, set()).add(uri)
+                pending_declarations.clear()
+
+        # Only start tags carry names and attributes; no tree is built
+        parser.StartNamespaceDeclHandler = start_namespace
+        parser.StartElementHandler = start_element
+
+        try:
+            with open(file_path, 'rb') as f:
+                # Large files are mapped so expat reads the page cache directly
+                if file_path.stat().st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        parser.Parse(mm, True)
+                else:
+                    parser.ParseFile(f)
+        except Exception as e:
+            raise ValueError(f"Failed to parse XML: {str(e)}")
+
+        # Derive both naming forms once per distinct attribute name rather
+        # than on every element; value sets are shared between the forms
+        for element, raw in raw_by_name.items():
+            clark: Dict[str, Set[str]] = {}
+            qualified: Dict[str, Set[str]] = {}
+            for attr_name, values in raw.items():
+                if '}' not in attr_name:
+                    clark[attr_name] = qualified[attr_name] = values
+                    continue
+
+                uri, local, prefix = attr_name.split('}')
+                clark_name = f"{{{uri}}}{local}"
+                # Two prefixes bound to one URI name the same lxml attribute
+                seen = clark.get(clark_name)
+                clark[clark_name] = values if seen is None else seen | values
+                qualified[f"{prefix}:{local}"] = values
+
+            qualified.update(declared_by_name.get(element, {}))
+            index._attributes[element] = clark
+            index._qualified_attributes[element] = qualified
+
+        # Sort element names here, on the scanning thread, not on first display
+        index.get_sorted_element_names()
+
+        return index
+
+    def get_sorted_element_names(self) -> List[str]:
+        """Get sorted unique element names, sorted once per index"""
+        return self._sorted_once((None, None, False), self._element_names)
+
+    def get_sorted_attributes(self, element_name: str, qualified: bool = False) -> List[str]:
+        """Get sorted attribute names of element type, sorted once per element"""
+        key = element_name.lower()
+        attributes = self._attributes_by_name(qualified).get(key, ())
+        return self._sorted_once((key, None, qualified), attributes)
+
+    def get_sorted_attribute_values(
+        self,
+        element_name: str,
+        attribute_name: str,
+        qualified: bool = False
+    ) -> List[str]:
+        """Get sorted values of attribute, sorted once per element and attribute"""
+        key = element_name.lower()
+        values = self._attributes_by_name(qualified).get(key, {}).get(attribute_name, ())
+        return self._sorted_once((key, attribute_name, qualified), values)
+
+    def _attributes_by_name(self, qualified: bool) -> Dict[str, Dict[str, Set[str]]]:
+        """
+        Select attribute naming form
+
+        Args:
+            qualified: True for "prefix:local" names (see
+                IXMLParser.qualified_attribute_names), False for "{uri}local"
+        """
+        return self._qualified_attributes if qualified else self._attributes
+
+    def _sorted_once(
+        self,
+        key: Tuple[Optional[str], Optional[str], bool],
+        items
+    ) -> List[str]:
+        """Sort items on first request and serve the memoized list after"""
+        cached = self._sorted.get(key)
+        if cached is None:
+            cached = self._sorted[key] = sorted(items)
+        return cached
@@ -1,11 +1,41 @@
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from lxml import etree # type: ignore
 
 
+from src.parsers.base_parser import LXML_PARSE_OPTIONS
 from src.utils import Logger
 
 
+# Source documents use the strategies' parse options, except that whitespace
+# is kept since it can affect XSLT output
+_XML_PARSE_OPTIONS = {**LXML_PARSE_OPTIONS, 'remove_blank_text': False}
+
+_thread_state = threading.local()
+
+
+def _xml_parser() -> etree.XMLParser:
+    """
+    Return the source document parser for the current thread
+    Transforms run on pooled threads and an lxml parser must not be shared
+    """
+    parser = getattr(_thread_state, 'parser', None)
+    if parser is None:
+        parser = _thread_state.parser = etree.XMLParser(**_XML_PARSE_OPTIONS)
+    return parser
+
+
+@lru_cache(maxsize=8)
+def _load_stylesheet(xsl_path: str, mtime_ns: int) -> etree.XSLT:
+    """
+    Parse and compile XSL stylesheet once per file version
+    mtime_ns is part of the cache key so edited stylesheets are recompiled
+    """
+    return etree.XSLT(etree.parse(xsl_path))
+
+
 class XMLTransformer:
     """
     Transforms XML documents to HTML using XSLT
@@ -18,7 +48,7 @@ class XMLTransformer:
         xml_file: Path,
         xsl_file: Path,
         output_file: Optional[Path] = None
-    ) -> str:
+    ) -> bytes:
         """
         Transform XML to HTML using XSLT
 
@@ -28,7 +58,7 @@ class XMLTransformer:
             output_file: Optional path to save HTML output
 
         Returns:
-            HTML content as string
+            HTML content as bytes, encoded as declared by xsl:output
 
         Raises:
             FileNotFoundError: If XML or XSL file not found
@@ -41,26 +71,27 @@ class XMLTransformer:
 
         try:
 
-            # Parse XML and XSL
-            xml_doc = etree.parse(str(xml_file))
-            xsl_doc = etree.parse(str(xsl_file))
+            # Parse XML
+            xml_doc = etree.parse(str(xml_file), parser=_xml_parser())
 
-            # Create transformer
-            transform = etree.XSLT(xsl_doc)
+            # Get compiled transformer (cached per stylesheet version)
+            xsl_path = xsl_file.resolve()
+            transform = _load_stylesheet(str(xsl_path), xsl_path.stat().st_mtime_ns)
 
             # Apply transformation
             result_tree = transform(xml_doc)
 
-            # Convert to string
-            html_content = str(result_tree)
+            # Serialize once; the same bytes are written and returned
+            html_content = bytes(result_tree)
 
             # Log transformation
             logger = Logger()
             logger.log_transformation(
-                f'XML → HTML трансформація. '
-                f'Джерело: {xml_file.name}, '
-                f'XSLT: {xsl_file.name}, '
-                f'Розмір результату: {len(html_content)} байт'
+                'XML → HTML трансформація. Джерело: %s, XSLT: %s, '
+                'Розмір результату: %d байт',
+                xml_file.name,
+                xsl_file.name,
+                len(html_content)
             )
 
             # Save to file if requested
@@ -87,21 +118,22 @@ class XMLTransformer:
         if not file_path.is_file():
             raise ValueError(f"{file_type} path is not a file: {file_path}")
 
-    def _save_html(self, html_content: str, output_file: Path) -> None:
+    def _save_html(self, html_content: bytes, output_file: Path) -> None:
         """
         Save HTML content to file
         Responsibility: File I/O for HTML output
         """
         try:
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(html_content, encoding='utf-8')
+            output_file.write_bytes(html_content)
 
             # Log saving operation
             logger = Logger()
             logger.log_saving(
-                f'Збережено HTML файл: {output_file.name}, '
-                f'Розмір: {len(html_content)} байт, '
-                f'Шлях: {output_file.parent}'
+                'Збережено HTML файл: %s, Розмір: %d байт, Шлях: %s',
+                output_file.name,
+                len(html_content),
+                output_file.parent
             )
 
         except Exception as e:
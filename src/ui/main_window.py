@@ -1,24 +1,71 @@
+import functools
+import os
+import tempfile
 import webbrowser
 import asyncio
+import threading
 from pathlib import Path
-from typing import Optional, Dict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, Dict
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QComboBox, QTextEdit,
+    QPushButton, QLabel, QComboBox, QPlainTextEdit,
     QFileDialog, QMessageBox, QGroupBox, QGridLayout,
-    QProgressBar, QLineEdit, QDialog, QListWidget, QListWidgetItem
+    QProgressBar, QLineEdit, QDialog, QListWidget
+)
+from PySide6.QtCore import (
+    Qt, QThreadPool, QRunnable, QObject, QTimer, QStringListModel, QFileSystemWatcher,
+    Signal
 )
-from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QFont, QCloseEvent
 
-from src.parsers.base_parser import IXMLParser
+from src.parsers.base_parser import IXMLParser, ParseCancelledError
 from src.parsers import SAXParserStrategy, DOMParserStrategy, ElementTreeParserStrategy
 from src.models.search_models import SearchQuery, SearchResult
 from src.services.xml_transformer import XMLTransformer
-from src.infrastructure import GoogleAuthService, GoogleDriveDocumentStorage
+from src.services.xml_metadata import XMLMetadataIndex
 from src.utils import SearchResultXMLConverter
 
+if TYPE_CHECKING:
+    # Google client libraries are imported on first Drive use (see
+    # _authenticate_google); they add noticeably to startup time
+    from src.infrastructure import GoogleAuthService, GoogleDriveDocumentStorage
+
+
+# Delay after the last keystroke before dependent combos are reloaded
+COMBO_RELOAD_DELAY_MS = 250
+
+# Frame around each search result dump in the results pane
+RESULTS_SEPARATOR = "=" * 60
+
+# Leading entry of the attribute/value combos meaning "no filter"
+ANY_ITEM = "(Any)"
+
+# Oldest lines are dropped from the results pane beyond this many
+RESULTS_MAX_LINES = 100_000
+
+# Identity of an XML file version: (path, mtime_ns, size); size catches
+# rewrites that land within the file system's timestamp granularity
+MetadataKey = tuple[Path, int, int]
+
+# How long closing the window waits for background work to wind down
+SHUTDOWN_WAIT_MS = 500
+
+# How long transient notices stay in the status bar
+STATUS_MESSAGE_MS = 5000
+
+# Directory Drive downloads are streamed into; resolved once at import
+DRIVE_DOWNLOAD_DIR = Path(tempfile.gettempdir())
+
+# Colours of status labels keyed by their "status" property; parsed once
+# for the whole window instead of a style sheet per label change
+STATUS_STYLE_SHEET = (
+    'QLabel[status="unset"] { color: gray; }'
+    'QLabel[status="set"] { color: green; }'
+    'QLabel[status="drive"] { color: blue; }'
+)
+
 
 class DriveFileDialog(QDialog):
     """
@@ -40,12 +87,19 @@ class DriveFileDialog(QDialog):
 
         # File list
         self.file_list = QListWidget()
+        self.file_list.setUniformItemSizes(True)
         self.file_list.itemDoubleClicked.connect(self._on_item_double_clicked)
 
-        for file in files:
-            item = QListWidgetItem(f"{file['name']} ({file.get('mimeType', 'unknown')})")
-            item.setData(Qt.ItemDataRole.UserRole, file)
-            self.file_list.addItem(item)
+        # Insert all rows in one call, then attach file data by row
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            self.file_list.addItems(
+                [f"{file['name']} ({file.get('mimeType', 'unknown')})" for file in files]
+            )
+            for row, file in enumerate(files):
+                self.file_list.item(row).setData(Qt.ItemDataRole.UserRole, file)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
 
         layout.addWidget(self.file_list)
 
@@ -77,80 +131,237 @@ class DriveFileDialog(QDialog):
         self.accept()
 
 
-class ParserWorker(QThread):
+class ParserWorkerSignals(QObject):
+    """
+    Signals of ParserWorker (QRunnable itself cannot emit signals)
+    Responsibility: Deliver parsing results back to the UI thread
+    """
+    finished = Signal(object, SearchResult)  # (emitting ParserWorker, result)
+    error = Signal(object, str)  # (emitting ParserWorker, message)
+
+
+class ParserWorker(QRunnable):
     """
     Background worker for parsing operations
-    Responsibility: Execute parsing in separate thread to keep UI responsive
+    Responsibility: Execute parsing on the shared thread pool to keep UI responsive
     """
-    finished = Signal(SearchResult)
-    error = Signal(str)
 
     def __init__(self, parser: IXMLParser, file_path: Path, query: SearchQuery):
         super().__init__()
         self.parser = parser
         self.file_path = file_path
         self.query = query
+        self.signals = ParserWorkerSignals()
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """Ask the running parse to stop; no signals are emitted afterwards"""
+        self.cancel_event.set()
 
     def run(self):
         """Execute parsing operation"""
         try:
-            result = self.parser.parse(self.file_path, self.query)
-            self.finished.emit(result)
+            result = self.parser.parse(self.file_path, self.query, self.cancel_event)
+            if not self.cancel_event.is_set():
+                self.signals.finished.emit(self, result)
+        except ParseCancelledError:
+            pass
         except Exception as e:
-            self.error.emit(str(e))
+            if not self.cancel_event.is_set():
+                self.signals.error.emit(self, str(e))
 
 
-class GoogleDriveWorker(QThread):
+class MetadataWorkerSignals(QObject):
     """
-    Background worker for Google Drive operations
-    Responsibility: Execute async Google Drive operations in separate thread
+    Signals of MetadataWorker
+    Responsibility: Deliver built metadata index back to the UI thread
     """
-    finished = Signal(str)  # file_id
-    error = Signal(str)
+    finished = Signal(object, object)  # (path, mtime_ns, size) key, XMLMetadataIndex
+    error = Signal(object, str)  # (path, mtime_ns, size) key, message
 
-    def __init__(self, operation, *args, **kwargs):
+
+class MetadataWorker(QRunnable):
+    """
+    Background worker for building XML metadata index
+    Responsibility: Scan XML file on the shared thread pool off the UI thread
+    """
+
+    def __init__(self, key: MetadataKey):
         super().__init__()
-        self.operation = operation
-        self.args = args
-        self.kwargs = kwargs
+        self.key = key
+        self.signals = MetadataWorkerSignals()
 
     def run(self):
-        """Execute async operation"""
+        """Execute metadata scan"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.operation(*self.args, **self.kwargs))
-            loop.close()
-            self.finished.emit(result if result else "success")
+            index = XMLMetadataIndex.from_file(self.key[0])
+            self.signals.finished.emit(self.key, index)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(self.key, str(e))
 
 
-class DriveDownloadWorker(QThread):
+class TransformWorkerSignals(QObject):
     """
-    Background worker for downloading files from Google Drive
-    Responsibility: Download file and return its content
+    Signals of TransformWorker
+    Responsibility: Deliver XSLT output back to the UI thread
+    """
+    finished = Signal(object, object, object)  # inputs key, output path, HTML bytes
+    error = Signal(str, str)  # title, message
+
+
+class TransformWorker(QRunnable):
+    """
+    Background worker for XSLT transformation
+    Responsibility: Run XML → HTML transformation on the shared thread pool
     """
-    finished = Signal(dict)  # file_data with 'content', 'name', 'mimeType'
-    error = Signal(str)
 
-    def __init__(self, storage, file_id: str):
+    def __init__(
+        self,
+        transformer: XMLTransformer,
+        key: tuple[Path, int, Path, int],
+        output_file: Path
+    ):
         super().__init__()
-        self.storage = storage
-        self.file_id = file_id
+        self.transformer = transformer
+        self.key = key
+        self.output_file = output_file
+        self.signals = TransformWorkerSignals()
 
     def run(self):
-        """Execute download operation"""
+        """Execute transformation"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            file_data = loop.run_until_complete(
-                self.storage.download_document(self.file_id)
+            html_content = self.transformer.transform(
+                self.key[0],
+                self.key[2],
+                self.output_file
             )
-            loop.close()
-            self.finished.emit(file_data)
+            self.signals.finished.emit(self.key, self.output_file, html_content)
+        except ImportError as e:
+            self.signals.error.emit("Missing Dependency", str(e))
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(
+                "Transformation Error",
+                f"Failed to transform XML: {str(e)}"
+            )
+
+
+class DriveTaskSignals(QObject):
+    """
+    Signals of a coroutine submitted to DriveEventLoop
+    Responsibility: Deliver Google Drive results back to the UI thread
+    """
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class DriveEventLoop:
+    """
+    Persistent asyncio event loop on a background thread
+    Responsibility: Run Google Drive coroutines without a new thread and
+    event loop per operation
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        on_finished: Callable[[Any], None],
+        on_error: Callable[[str], None]
+    ) -> DriveTaskSignals:
+        """
+        Schedule coroutine on the loop, starting the loop on first use
+
+        Handlers are connected before scheduling, so fast coroutines cannot
+        finish unobserved; they run on the UI thread.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run, name='drive-loop', daemon=True
+            )
+            self._thread.start()
+
+        signals = DriveTaskSignals()
+        signals.finished.connect(on_finished)
+        signals.error.connect(on_error)
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(lambda f: self._deliver(f, signals))
+        return signals
+
+    def _run(self):
+        """Serve the loop until stop() is called"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _deliver(self, future: Future, signals: DriveTaskSignals):
+        """Report finished coroutine through its signals"""
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            signals.error.emit(str(error))
+        else:
+            signals.finished.emit(future.result())
+
+    def discard(self, coro: Coroutine[Any, Any, Any]):
+        """
+        Schedule a cleanup coroutine whose outcome nobody waits for
+
+        Without a running loop nothing was ever opened on it, so the
+        coroutine is closed unscheduled.
+        """
+        if self._loop is None:
+            coro.close()
+            return
+
+        asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(
+        self,
+        timeout_ms: int,
+        close: Optional[Callable[[], Coroutine[Any, Any, Any]]] = None
+    ):
+        """
+        Cancel pending Drive operations, run close on the loop, stop it and
+        wait up to timeout_ms for its thread to exit
+        """
+        if self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._cancel_and_stop(close), self._loop)
+        self._thread.join(timeout_ms / 1000)
+
+        # Drop Drive calls still queued for the worker threads; exit then
+        # waits only for the calls already in progress
+        from src.infrastructure.drive_client import shutdown_executor
+        shutdown_executor()
+
+    async def _cancel_and_stop(
+        self,
+        close: Optional[Callable[[], Coroutine[Any, Any, Any]]]
+    ):
+        """
+        Cancel running coroutines, release Drive resources once they unwind
+        and stop the loop
+        Responsibility: Let operations run their cleanup (partial downloads,
+        open files, HTTP sessions) instead of being frozen mid-request
+        """
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if close is not None:
+                await close()
+        finally:
+            self._loop.stop()
 
 
 class MainWindow(QMainWindow):
@@ -164,28 +375,53 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("XML Parser")
         self.setMinimumSize(1600, 1200)
 
-        # Initialize parsers (Strategy pattern)
-        self.parsers: Dict[str, IXMLParser] = {
-            "SAX Parser": SAXParserStrategy(),
-            "DOM Parser": DOMParserStrategy(),
-            "ElementTree (LINQ to XML)": ElementTreeParserStrategy()
+        # Parser strategies (Strategy pattern), created on first use
+        self._parser_factories: Dict[str, Callable[[], IXMLParser]] = {
+            "SAX Parser": SAXParserStrategy,
+            "DOM Parser": DOMParserStrategy,
+            "ElementTree (LINQ to XML)": ElementTreeParserStrategy
         }
+        self._parser_instances: Dict[str, IXMLParser] = {}
 
         # Initialize services
         self.transformer = XMLTransformer()
 
         # Google Drive services
-        self.auth_service: Optional[GoogleAuthService] = None
-        self.drive_storage: Optional[GoogleDriveDocumentStorage] = None
+        self.auth_service: Optional['GoogleAuthService'] = None
+        self.drive_storage: Optional['GoogleDriveDocumentStorage'] = None
 
         # State
         self.current_xml_file: Optional[Path] = None
         self.current_xsl_file: Optional[Path] = None
+        # Directories the file dialogs open in; follow the user's last pick
+        self._last_xml_dir = str(Path.cwd() / "data")
+        self._last_xsl_dir = self._last_xml_dir
         self.worker: Optional[ParserWorker] = None
-        self.drive_worker: Optional[GoogleDriveWorker] = None
-        self.download_worker: Optional[DriveDownloadWorker] = None
+        self.drive_loop = DriveEventLoop()
+        self.drive_task: Optional[DriveTaskSignals] = None
+        self.download_task: Optional[DriveTaskSignals] = None
         self.last_search_result: Optional[SearchResult] = None
-        self.last_html_content: Optional[str] = None
+        self.last_html_content: Optional[bytes] = None
+
+        # Number of background operations showing the progress bar
+        self._busy = 0
+
+        # Metadata index of current XML file; dropped when the watcher
+        # reports a change, so lookups need no stat() call
+        self._metadata_index: Optional[XMLMetadataIndex] = None
+        self._xml_watcher = QFileSystemWatcher(self)
+        self._xml_watcher.fileChanged.connect(self._on_xml_file_changed)
+        self._metadata_worker: Optional[MetadataWorker] = None
+        self._metadata_pending: Optional[MetadataKey] = None
+        self._show_elements_on_ready = False
+
+        # (xml path, xml mtime_ns, xsl path, xsl mtime_ns) of the inputs
+        # behind output.html and last_html_content
+        self._last_transform_key: Optional[tuple[Path, int, Path, int]] = None
+        self._transform_worker: Optional[TransformWorker] = None
+        # Last transformation output and its file:// URI for the browser
+        self._last_output_path: Optional[Path] = None
+        self._last_output_uri: Optional[str] = None
 
         # Setup UI
         self._setup_ui()
@@ -196,6 +432,7 @@ class MainWindow(QMainWindow):
         Responsibility: Create and layout all UI elements
         """
         central_widget = QWidget()
+        central_widget.setStyleSheet(STATUS_STYLE_SHEET)
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
 
@@ -216,6 +453,7 @@ class MainWindow(QMainWindow):
 
         # Progress bar
         self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # Indeterminate
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
 
@@ -250,7 +488,7 @@ class MainWindow(QMainWindow):
         # XML file selection
         xml_label = QLabel("XML File:")
         self.xml_file_label = QLabel("No file selected")
-        self.xml_file_label.setStyleSheet("color: gray;")
+        self.xml_file_label.setProperty("status", "unset")
         xml_button = QPushButton("Browse XML...")
         xml_button.clicked.connect(self._browse_xml_file)
 
@@ -266,7 +504,7 @@ class MainWindow(QMainWindow):
         # XSL file selection
         xsl_label = QLabel("XSL File:")
         self.xsl_file_label = QLabel("No file selected")
-        self.xsl_file_label.setStyleSheet("color: gray;")
+        self.xsl_file_label.setProperty("status", "unset")
         xsl_button = QPushButton("Browse XSL...")
         xsl_button.clicked.connect(self._browse_xsl_file)
 
@@ -289,7 +527,12 @@ class MainWindow(QMainWindow):
 
         label = QLabel("Select Parser:")
         self.parser_combo = QComboBox()
-        self.parser_combo.addItems(list(self.parsers.keys()))
+        self.parser_combo.addItems(list(self._parser_factories.keys()))
+
+        # Resolve the selected strategy on selection, not on every search
+        self._active_parser_name = self.parser_combo.currentText()
+        self._active_parser = self._get_parser(self._active_parser_name)
+        self.parser_combo.currentTextChanged.connect(self._on_parser_changed)
 
         group_layout.addWidget(label)
         group_layout.addWidget(self.parser_combo)
@@ -298,16 +541,54 @@ class MainWindow(QMainWindow):
         group.setLayout(group_layout)
         layout.addWidget(group)
 
+    def _on_parser_changed(self, parser_name: str):
+        """Remember selected parser strategy"""
+        previous = self._active_parser
+        self._active_parser_name = parser_name
+        self._active_parser = self._get_parser(parser_name)
+
+        # Attribute combos must offer names in the form the strategy matches
+        if previous.qualified_attribute_names != self._active_parser.qualified_attribute_names:
+            self._on_element_changed(self.element_combo.currentText())
+
+    def _get_parser(self, parser_name: str) -> IXMLParser:
+        """Get parser strategy by name, creating it on first use"""
+        parser = self._parser_instances.get(parser_name)
+        if parser is None:
+            parser = self._parser_factories[parser_name]()
+            self._parser_instances[parser_name] = parser
+        return parser
+
     def _create_search_section(self, layout: QVBoxLayout):
         """Create search parameter controls"""
         group = QGroupBox("Search Parameters")
         group_layout = QGridLayout()
 
+        # Editable combos emit currentTextChanged per keystroke; reload
+        # dependent combos only once typing pauses
+        self._element_timer = QTimer(self)
+        self._element_timer.setSingleShot(True)
+        self._element_timer.setInterval(COMBO_RELOAD_DELAY_MS)
+        self._element_timer.timeout.connect(
+            lambda: self._on_element_changed(self.element_combo.currentText())
+        )
+
+        self._attribute_timer = QTimer(self)
+        self._attribute_timer.setSingleShot(True)
+        self._attribute_timer.setInterval(COMBO_RELOAD_DELAY_MS)
+        self._attribute_timer.timeout.connect(
+            lambda: self._on_attribute_changed(self.attribute_combo.currentText())
+        )
+
         # Element name
         elem_label = QLabel("Element Name:")
         self.element_combo = QComboBox()
         self.element_combo.setEditable(True)
-        self.element_combo.currentTextChanged.connect(self._on_element_changed)
+        # Combos are backed by string list models so a refresh is a single
+        # model reset instead of one insert per item
+        self._element_model = QStringListModel(self)
+        self.element_combo.setModel(self._element_model)
+        self.element_combo.currentTextChanged.connect(self._schedule_element_reload)
 
         group_layout.addWidget(elem_label, 0, 0)
         group_layout.addWidget(self.element_combo, 0, 1)
@@ -316,8 +597,9 @@ class MainWindow(QMainWindow):
         attr_label = QLabel("Attribute Name:")
         self.attribute_combo = QComboBox()
         self.attribute_combo.setEditable(True)
-        self.attribute_combo.addItem("(Any)")
-        self.attribute_combo.currentTextChanged.connect(self._on_attribute_changed)
+        self._attribute_model = QStringListModel([ANY_ITEM], self)
+        self.attribute_combo.setModel(self._attribute_model)
+        self.attribute_combo.currentTextChanged.connect(self._schedule_attribute_reload)
 
         group_layout.addWidget(attr_label, 1, 0)
         group_layout.addWidget(self.attribute_combo, 1, 1)
@@ -326,7 +608,8 @@ class MainWindow(QMainWindow):
         val_label = QLabel("Attribute Value:")
         self.value_combo = QComboBox()
         self.value_combo.setEditable(True)
-        self.value_combo.addItem("(Any)")
+        self._value_model = QStringListModel([ANY_ITEM], self)
+        self.value_combo.setModel(self._value_model)
 
         group_layout.addWidget(val_label, 2, 0)
         group_layout.addWidget(self.value_combo, 2, 1)
@@ -335,7 +618,7 @@ class MainWindow(QMainWindow):
         text_label = QLabel("Text Contains:")
         self.text_combo = QComboBox()
         self.text_combo.setEditable(True)
-        self.text_combo.addItem("(Any)")
+        self.text_combo.addItem(ANY_ITEM)
 
         group_layout.addWidget(text_label, 3, 0)
         group_layout.addWidget(self.text_combo, 3, 1)
@@ -371,8 +654,10 @@ class MainWindow(QMainWindow):
         group = QGroupBox("Search Results")
         group_layout = QVBoxLayout()
 
-        self.results_text = QTextEdit()
+        # Plain-text log widget: cheap appends, no rich-text layout
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
+        self.results_text.setMaximumBlockCount(RESULTS_MAX_LINES)
         self.results_text.setMinimumHeight(200)
 
         group_layout.addWidget(self.results_text)
@@ -404,14 +689,16 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select XML File",
-            str(Path.cwd() / "data"),
+            self._last_xml_dir,
             "XML Files (*.xml);;All Files (*)"
         )
 
         if file_path:
             self.current_xml_file = Path(file_path)
+            self._last_xml_dir = str(self.current_xml_file.parent)
+            self._reset_metadata()
             self.xml_file_label.setText(self.current_xml_file.name)
-            self.xml_file_label.setStyleSheet("color: green;")
+            self._set_label_status(self.xml_file_label, "set")
             self.load_data_button.setEnabled(True)
             self.search_button.setEnabled(True)
             self._update_transform_button()
@@ -421,64 +708,174 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select XSL File",
-            str(Path.cwd() / "data"),
+            self._last_xsl_dir,
             "XSL Files (*.xsl *.xslt);;All Files (*)"
         )
 
         if file_path:
             self.current_xsl_file = Path(file_path)
+            self._last_xsl_dir = str(self.current_xsl_file.parent)
             self.xsl_file_label.setText(self.current_xsl_file.name)
-            self.xsl_file_label.setStyleSheet("color: green;")
+            self._set_label_status(self.xsl_file_label, "set")
             self._update_transform_button()
 
+    def _set_label_status(self, label: QLabel, status: str):
+        """
+        Recolour status label through the window style sheet
+        Responsibility: Re-polish label after its "status" property changes
+        """
+        label.setProperty("status", status)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
     def _update_transform_button(self):
         """Update transform button state"""
         can_transform = (
             self.current_xml_file is not None and
-            self.current_xsl_file is not None
+            self.current_xsl_file is not None and
+            self._transform_worker is None
         )
         self.transform_button.setEnabled(can_transform)
 
-    def _load_xml_metadata(self):
-        """Load available element names and attributes from XML"""
-        if not self.current_xml_file:
-            return
+    def _reset_metadata(self):
+        """
+        Drop metadata of the previous XML file and start scanning the new one
+        The scan runs in the background so combos are ready before first use
+        """
+        self._metadata_index = None
+        self._metadata_pending = None
+
+        # Watch only the current XML file
+        watched = self._xml_watcher.files()
+        if watched:
+            self._xml_watcher.removePaths(watched)
+        self._xml_watcher.addPath(str(self.current_xml_file))
 
         try:
-            # Get current parser
-            parser_name = self.parser_combo.currentText()
-            parser = self.parsers[parser_name]
+            self._get_metadata_index()
+        except OSError:
+            pass  # Reported when metadata is actually requested
+
+    def _get_metadata_index(self) -> Optional[XMLMetadataIndex]:
+        """
+        Get metadata index of current XML file
+        Responsibility: Parse the file once per version for all combo lookups
+
+        Returns the cached index, or None after starting a background scan;
+        _on_metadata_ready refreshes the combos once the scan completes.
+        """
+        if self._metadata_index is not None:
+            return self._metadata_index
+
+        stat = self.current_xml_file.stat()
+        key = (self.current_xml_file, stat.st_mtime_ns, stat.st_size)
+
+        if self._metadata_pending != key:
+            self._metadata_pending = key
+            self._metadata_worker = MetadataWorker(key)
+            self._metadata_worker.signals.finished.connect(self._on_metadata_ready)
+            self._metadata_worker.signals.error.connect(self._on_metadata_error)
+            QThreadPool.globalInstance().start(self._metadata_worker)
+
+        return None
+
+    def _on_xml_file_changed(self, path: str):
+        """Rescan current XML file after it was modified on disk"""
+        # Editors that save by replacing the file drop the watch; re-add it
+        if path not in self._xml_watcher.files() and Path(path).exists():
+            self._xml_watcher.addPath(path)
+
+        self._metadata_index = None
+        self._metadata_pending = None
+
+        try:
+            self._get_metadata_index()
+        except OSError:
+            pass  # Reported when metadata is actually requested
+
+    def _on_metadata_ready(self, key: MetadataKey, index: XMLMetadataIndex):
+        """Handle metadata scan completion"""
+        # Ignore scans superseded by another file selection
+        if key != self._metadata_pending:
+            return
 
-            # Get all unique element names using ElementTree
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(str(self.current_xml_file))
-            root = tree.getroot()
+        self._metadata_pending = None
+        self._metadata_index = index
 
-            elements = set()
-            self._collect_element_names(root, elements)
+        if self._show_elements_on_ready:
+            self._show_elements_on_ready = False
+            self._populate_element_combo(index)
+        else:
+            self._on_element_changed(self.element_combo.currentText())
+
+    def _on_metadata_error(self, key: MetadataKey, error_msg: str):
+        """Handle metadata scan error"""
+        if key != self._metadata_pending:
+            return
 
-            # Update element combo
-            self.element_combo.clear()
-            self.element_combo.addItems(sorted(elements))
+        self._metadata_pending = None
 
-            self.results_text.append("✓ Loaded available elements from XML file")
+        if self._show_elements_on_ready:
+            self._show_elements_on_ready = False
+            QMessageBox.warning(
+                self,
+                "Load Error",
+                f"Failed to load XML metadata: {error_msg}"
+            )
 
+    def _load_xml_metadata(self):
+        """Load available element names and attributes from XML"""
+        if not self.current_xml_file:
+            return
+
+        try:
+            index = self._get_metadata_index()
         except Exception as e:
             QMessageBox.warning(
                 self,
                 "Load Error",
                 f"Failed to load XML metadata: {str(e)}"
             )
+            return
+
+        if index is None:
+            # Scan is running; elements are shown when it completes
+            self._show_elements_on_ready = True
+            self.results_text.appendPlainText("Loading available elements from XML file...")
+            return
+
+        self._populate_element_combo(index)
+
+    def _populate_element_combo(self, index: XMLMetadataIndex):
+        """Fill element combo from metadata index"""
+        self._set_combo_items(
+            self.element_combo, self._element_model, index.get_sorted_element_names()
+        )
+
+        self.results_text.appendPlainText("✓ Loaded available elements from XML file")
+
+        # Signals were blocked while repopulating; refresh dependents once
+        self._on_element_changed(self.element_combo.currentText())
+
+    def _set_combo_items(self, combo: QComboBox, model: QStringListModel, items: list[str]):
+        """
+        Replace combo items without emitting change signals per update
+        Responsibility: Keep repopulation from triggering dependent reloads
+        """
+        combo.blockSignals(True)
+        try:
+            model.setStringList(items)
+        finally:
+            combo.blockSignals(False)
 
-    def _collect_element_names(self, element, elements: set):
-        """Recursively collect all element names"""
-        tag = element.tag
-        if '}' in tag:
-            tag = tag.split('}', 1)[1]
-        elements.add(tag)
+    def _schedule_element_reload(self, _text: str):
+        """Restart debounce timer for attribute reload"""
+        self._element_timer.start()
 
-        for child in element:
-            self._collect_element_names(child, elements)
+    def _schedule_attribute_reload(self, _text: str):
+        """Restart debounce timer for value reload"""
+        self._attribute_timer.start()
 
     def _on_element_changed(self, element_name: str):
         """Handle element name change - load attributes"""
@@ -486,26 +883,29 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            parser_name = self.parser_combo.currentText()
-            parser = self.parsers[parser_name]
+            index = self._get_metadata_index()
+            if index is None:
+                return  # Refreshed by _on_metadata_ready
 
-            # Get available attributes
-            attributes = parser.get_available_attributes(
-                self.current_xml_file,
-                element_name
+            # Get available attributes, sorted once per element by the index
+            attributes = index.get_sorted_attributes(
+                element_name, self._active_parser.qualified_attribute_names
             )
 
             # Update attribute combo
-            self.attribute_combo.clear()
-            self.attribute_combo.addItem("(Any)")
-            self.attribute_combo.addItems(sorted(attributes))
+            self._set_combo_items(
+                self.attribute_combo,
+                self._attribute_model,
+                [ANY_ITEM, *attributes]
+            )
+            self._on_attribute_changed(self.attribute_combo.currentText())
 
         except Exception:
             pass  # Silently ignore errors during dynamic loading
 
     def _on_attribute_changed(self, attribute_name: str):
         """Handle attribute name change - load values"""
-        if not self.current_xml_file or not attribute_name or attribute_name == "(Any)":
+        if not self.current_xml_file or not attribute_name or attribute_name == ANY_ITEM:
             return
 
         element_name = self.element_combo.currentText()
@@ -513,20 +913,23 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            parser_name = self.parser_combo.currentText()
-            parser = self.parsers[parser_name]
+            index = self._get_metadata_index()
+            if index is None:
+                return  # Refreshed by _on_metadata_ready
 
-            # Get available values
-            values = parser.get_attribute_values(
-                self.current_xml_file,
+            # Get available values, sorted once per attribute by the index
+            values = index.get_sorted_attribute_values(
                 element_name,
-                attribute_name
+                attribute_name,
+                self._active_parser.qualified_attribute_names
             )
 
             # Update value combo
-            self.value_combo.clear()
-            self.value_combo.addItem("(Any)")
-            self.value_combo.addItems(sorted(values))
+            self._set_combo_items(
+                self.value_combo,
+                self._value_model,
+                [ANY_ITEM, *values]
+            )
 
         except Exception:
             pass  # Silently ignore errors during dynamic loading
@@ -549,31 +952,42 @@ class MainWindow(QMainWindow):
 
         query = SearchQuery(
             element_name=element_name,
-            attribute_name=attribute_name if attribute_name != "(Any)" else None,
-            attribute_value=attribute_value if attribute_value != "(Any)" else None,
-            text_contains=text_contains if text_contains != "(Any)" else None
+            attribute_name=attribute_name if attribute_name != ANY_ITEM else None,
+            attribute_value=attribute_value if attribute_value != ANY_ITEM else None,
+            text_contains=text_contains if text_contains != ANY_ITEM else None
         )
 
         # Get selected parser
-        parser_name = self.parser_combo.currentText()
-        parser = self.parsers[parser_name]
+        parser_name = self._active_parser_name
+        parser = self._active_parser
 
-        # Execute in background thread
+        # Abandon a search still in flight so it stops using CPU and cannot
+        # report into the new search's UI state
+        if self.worker:
+            self.worker.cancel()
+            self._busy_end()
+
+        # Execute on the shared thread pool
         self.worker = ParserWorker(parser, self.current_xml_file, query)
-        self.worker.finished.connect(self._on_search_finished)
-        self.worker.error.connect(self._on_search_error)
+        self.worker.signals.finished.connect(self._on_search_finished)
+        self.worker.signals.error.connect(self._on_search_error)
 
         # Update UI
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate
+        self._busy_begin()
         self.search_button.setEnabled(False)
-        self.results_text.append(f"\nSearching with {parser_name}...")
+        self.results_text.appendPlainText(f"\nSearching with {parser_name}...")
 
-        self.worker.start()
+        QThreadPool.globalInstance().start(self.worker)
 
-    def _on_search_finished(self, result: SearchResult):
+    def _on_search_finished(self, worker: ParserWorker, result: SearchResult):
         """Handle search completion"""
-        self.progress_bar.setVisible(False)
+        # A search cancelled after it had already queued its result must not
+        # touch the state of the search that replaced it
+        if worker is not self.worker:
+            return
+
+        self.worker = None
+        self._busy_end()
         self.search_button.setEnabled(True)
 
         # Save result for Google Drive upload
@@ -581,13 +995,43 @@ class MainWindow(QMainWindow):
         self._update_drive_buttons_state()
 
         # Display results
-        self.results_text.append("\n" + "=" * 60)
-        self.results_text.append(result.to_detailed_string())
-        self.results_text.append("=" * 60)
+        self._append_results_block(
+            f"\n{RESULTS_SEPARATOR}\n{result.to_detailed_string()}\n{RESULTS_SEPARATOR}"
+        )
+
+    def _busy_begin(self):
+        """
+        Register started background operation
+        Responsibility: Show progress bar only when the first operation starts
+        """
+        self._busy += 1
+        if self._busy == 1:
+            self.progress_bar.setVisible(True)
 
-    def _on_search_error(self, error_msg: str):
+    def _busy_end(self):
+        """
+        Register finished background operation
+        Responsibility: Hide progress bar only when the last operation ends
+        """
+        self._busy = max(self._busy - 1, 0)
+        if self._busy == 0:
+            self.progress_bar.setVisible(False)
+
+    def _append_results_block(self, text: str):
+        """
+        Append plain text to results as a single edit
+        Responsibility: Avoid one relayout/repaint per line for large result dumps
+        """
+        self.results_text.appendPlainText(text)
+
+    def _on_search_error(self, worker: ParserWorker, error_msg: str):
         """Handle search error"""
-        self.progress_bar.setVisible(False)
+        # Ignore errors of superseded searches (see _on_search_finished)
+        if worker is not self.worker:
+            return
+
+        self.worker = None
+        self._busy_end()
         self.search_button.setEnabled(True)
 
         QMessageBox.critical(
@@ -613,46 +1057,84 @@ class MainWindow(QMainWindow):
             # Generate output file path
             output_file = self.current_xml_file.parent / "output.html"
 
-            # Transform
-            html_content = self.transformer.transform(
+            key = (
                 self.current_xml_file,
+                self.current_xml_file.stat().st_mtime_ns,
                 self.current_xsl_file,
-                output_file
-            )
-
-            # Save HTML content for Google Drive upload
-            self.last_html_content = html_content
-            self._update_drive_buttons_state()
-
-            self.results_text.append(f"\n✓ Transformation successful!")
-            self.results_text.append(f"Output saved to: {output_file}")
-
-            self.view_html_button.setEnabled(True)
-
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Transformation completed!\nOutput: {output_file}"
-            )
-
-        except ImportError as e:
-            QMessageBox.critical(
-                self,
-                "Missing Dependency",
-                str(e)
+                self.current_xsl_file.stat().st_mtime_ns
             )
-        except Exception as e:
+        except OSError as e:
             QMessageBox.critical(
                 self,
                 "Transformation Error",
                 f"Failed to transform XML: {str(e)}"
             )
+            return
+
+        # Re-run XSLT only when an input changed or the output is gone
+        if key == self._last_transform_key and output_file.exists():
+            self._show_transform_result(output_file)
+            return
+
+        # Transform on the shared thread pool
+        self._transform_worker = TransformWorker(self.transformer, key, output_file)
+        self._transform_worker.signals.finished.connect(self._on_transform_finished)
+        self._transform_worker.signals.error.connect(self._on_transform_error)
+
+        # Update UI
+        self._busy_begin()
+        self.transform_button.setEnabled(False)
+
+        QThreadPool.globalInstance().start(self._transform_worker)
+
+    def _on_transform_finished(
+        self,
+        key: tuple[Path, int, Path, int],
+        output_file: Path,
+        html_content: bytes
+    ):
+        """Handle transformation completion"""
+        self._transform_worker = None
+        self._busy_end()
+        self._update_transform_button()
+
+        # Save HTML content for Google Drive upload
+        self.last_html_content = html_content
+        self._last_transform_key = key
+        self._update_drive_buttons_state()
+
+        self._show_transform_result(output_file)
+
+    def _on_transform_error(self, title: str, error_msg: str):
+        """Handle transformation error"""
+        self._transform_worker = None
+        self._busy_end()
+        self._update_transform_button()
+
+        QMessageBox.critical(self, title, error_msg)
+
+    def _show_transform_result(self, output_file: Path):
+        """Report transformation output and enable viewing it"""
+        if output_file != self._last_output_path:
+            self._last_output_path = output_file
+            self._last_output_uri = output_file.resolve().as_uri()
+
+        self._append_results_block(
+            f"\n✓ Transformation successful!\nOutput saved to: {output_file}"
+        )
+
+        self.view_html_button.setEnabled(True)
+
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Transformation completed!\nOutput: {output_file}"
+        )
 
     def _view_html(self):
         """Open generated HTML in browser"""
-        output_file = self.current_xml_file.parent / "output.html"
-        if output_file.exists():
-            webbrowser.open(output_file.as_uri())
+        if self._last_output_path and os.path.isfile(self._last_output_path):
+            webbrowser.open(self._last_output_uri)
         else:
             QMessageBox.warning(
                 self,
@@ -668,7 +1150,7 @@ class MainWindow(QMainWindow):
         # Authentication status
         auth_label = QLabel("Status:")
         self.auth_status_label = QLabel("Not authenticated")
-        self.auth_status_label.setStyleSheet("color: gray;")
+        self.auth_status_label.setProperty("status", "unset")
 
         group_layout.addWidget(auth_label, 0, 0)
         group_layout.addWidget(self.auth_status_label, 0, 1)
@@ -705,15 +1187,20 @@ class MainWindow(QMainWindow):
     def _authenticate_google(self):
         """Handle Google authentication"""
         try:
+            from src.infrastructure import GoogleAuthService, GoogleDriveDocumentStorage
+
             if self.auth_service:
                 self.auth_service.logout()
             else:
                 self.auth_service = GoogleAuthService()
             self.auth_service.authenticate()
+            if self.drive_storage:
+                # Sessions of the replaced storage live on the Drive loop
+                self.drive_loop.discard(self.drive_storage.close())
             self.drive_storage = GoogleDriveDocumentStorage(self.auth_service)
 
             self.auth_status_label.setText("Authenticated")
-            self.auth_status_label.setStyleSheet("color: green;")
+            self._set_label_status(self.auth_status_label, "set")
             self.auth_button.setText("Re-authenticate")
 
             self._update_drive_buttons_state()
@@ -761,25 +1248,20 @@ class MainWindow(QMainWindow):
             file_name += '.xml'
 
         try:
-            # Convert search results to XML
-            xml_content = SearchResultXMLConverter.convert_to_xml(self.last_search_result)
-
-            # Upload in background
-            self.drive_worker = GoogleDriveWorker(
-                self.drive_storage.upload_document,
-                xml_content,
-                file_name,
-                'xml'
+            # Serialize and upload in background: the XML is streamed into a
+            # spooled temp file and sent from there chunk by chunk
+            write_content = functools.partial(
+                SearchResultXMLConverter.write_xml, self.last_search_result
+            )
+            self.drive_task = self.drive_loop.submit(
+                self.drive_storage.upload_document_stream(write_content, file_name, 'xml'),
+                self._on_upload_finished,
+                self._on_upload_error
             )
-            self.drive_worker.finished.connect(self._on_upload_finished)
-            self.drive_worker.error.connect(self._on_upload_error)
 
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)
+            self._busy_begin()
             self.upload_xml_button.setEnabled(False)
-            self.results_text.append(f"\nUploading {file_name} to Google Drive...")
-
-            self.drive_worker.start()
+            self.results_text.appendPlainText(f"\nUploading {file_name} to Google Drive...")
 
         except Exception as e:
             QMessageBox.critical(
@@ -801,21 +1283,15 @@ class MainWindow(QMainWindow):
 
         try:
             # Upload in background
-            self.drive_worker = GoogleDriveWorker(
-                self.drive_storage.upload_document,
-                self.last_html_content,
-                file_name,
-                'html'
+            self.drive_task = self.drive_loop.submit(
+                self.drive_storage.upload_document(self.last_html_content, file_name, 'html'),
+                self._on_upload_finished,
+                self._on_upload_error
             )
-            self.drive_worker.finished.connect(self._on_upload_finished)
-            self.drive_worker.error.connect(self._on_upload_error)
 
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)
+            self._busy_begin()
             self.upload_html_button.setEnabled(False)
-            self.results_text.append(f"\nUploading {file_name} to Google Drive...")
-
-            self.drive_worker.start()
+            self.results_text.appendPlainText(f"\nUploading {file_name} to Google Drive...")
 
         except Exception as e:
             QMessageBox.critical(
@@ -824,12 +1300,13 @@ class MainWindow(QMainWindow):
                 f"Failed to prepare upload: {str(e)}"
             )
 
-    def _on_upload_finished(self, file_id: str):
+    def _on_upload_finished(self, file_id: Optional[str]):
         """Handle upload completion"""
-        self.progress_bar.setVisible(False)
+        file_id = file_id or "success"
+        self._busy_end()
         self._update_drive_buttons_state()
 
-        self.results_text.append(f"Upload successful! File ID: {file_id}")
+        self.results_text.appendPlainText(f"Upload successful! File ID: {file_id}")
 
         QMessageBox.information(
             self,
@@ -839,7 +1316,7 @@ class MainWindow(QMainWindow):
 
     def _on_upload_error(self, error_msg: str):
         """Handle upload error"""
-        self.progress_bar.setVisible(False)
+        self._busy_end()
         self._update_drive_buttons_state()
 
         QMessageBox.critical(
@@ -853,123 +1330,103 @@ class MainWindow(QMainWindow):
         if not self.drive_storage:
             return
 
-        try:
-            # Get list of XML files
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            files = loop.run_until_complete(
-                self.drive_storage.list_documents(['xml'])
-            )
-            loop.close()
-
-            if not files:
-                QMessageBox.information(
-                    self,
-                    "No Files",
-                    "No XML files found on Google Drive."
-                )
-                return
-
-            # Show selection dialog
-            dialog = DriveFileDialog(files, "Select XML File from Google Drive", self)
-            if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_file:
-                selected = dialog.selected_file
-
-                # Download file in background using specialized worker
-                self.download_worker = DriveDownloadWorker(
-                    self.drive_storage,
-                    selected['id']
-                )
-                self.download_worker.finished.connect(self._on_xml_downloaded)
-                self.download_worker.error.connect(self._on_download_error)
-
-                self.progress_bar.setVisible(True)
-                self.progress_bar.setRange(0, 0)
-                self.results_text.append(f"\nDownloading {selected['name']} from Google Drive...")
-
-                self.download_worker.start()
-
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Load Error",
-                f"Failed to load XML files list: {str(e)}"
-            )
+        # Get list of XML files in background
+        self._list_drive_files('xml', self._on_xml_files_listed)
 
     def _load_xsl_from_drive(self):
         """Load XSL file from Google Drive"""
         if not self.drive_storage:
             return
 
-        try:
-            # Get list of XSL files
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            files = loop.run_until_complete(
-                self.drive_storage.list_documents(['xsl'])
-            )
-            loop.close()
-
-            if not files:
-                QMessageBox.information(
-                    self,
-                    "No Files",
-                    "No XSL files found on Google Drive."
-                )
-                return
-
-            # Show selection dialog
-            dialog = DriveFileDialog(files, "Select XSL File from Google Drive", self)
-            if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_file:
-                selected = dialog.selected_file
-
-                # Download file in background using specialized worker
-                self.download_worker = DriveDownloadWorker(
-                    self.drive_storage,
-                    selected['id']
-                )
-                self.download_worker.finished.connect(self._on_xsl_downloaded)
-                self.download_worker.error.connect(self._on_download_error)
-
-                self.progress_bar.setVisible(True)
-                self.progress_bar.setRange(0, 0)
-                self.results_text.append(f"\nDownloading {selected['name']} from Google Drive...")
-
-                self.download_worker.start()
+        # Get list of XSL files in background
+        self._list_drive_files('xsl', self._on_xsl_files_listed)
 
-        except Exception as e:
-            QMessageBox.critical(
+    def _list_drive_files(self, file_type: str, on_listed: Callable[[list], None]):
+        """Request Drive file list on the Drive event loop"""
+        self.drive_task = self.drive_loop.submit(
+            self.drive_storage.list_documents([file_type]),
+            on_listed,
+            self._on_drive_list_error
+        )
+
+        self._busy_begin()
+
+    def _on_xml_files_listed(self, files: list):
+        """Let user pick listed XML file and download it"""
+        self._select_drive_file(files, "XML", self._on_xml_downloaded)
+
+    def _on_xsl_files_listed(self, files: list):
+        """Let user pick listed XSL file and download it"""
+        self._select_drive_file(files, "XSL", self._on_xsl_downloaded)
+
+    def _select_drive_file(
+        self,
+        files: list,
+        file_type: str,
+        on_downloaded: Callable[[dict], None]
+    ):
+        """Show Drive file selection dialog and start download of chosen file"""
+        self._busy_end()
+
+        if not files:
+            QMessageBox.information(
                 self,
-                "Load Error",
-                f"Failed to load XSL files list: {str(e)}"
+                "No Files",
+                f"No {file_type} files found on Google Drive."
+            )
+            return
+
+        # Show selection dialog
+        dialog = DriveFileDialog(files, f"Select {file_type} File from Google Drive", self)
+        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_file:
+            selected = dialog.selected_file
+
+            # Download file in background on the Drive event loop
+            self.download_task = self.drive_loop.submit(
+                self.drive_storage.download_document_to_file(
+                    selected['id'],
+                    DRIVE_DOWNLOAD_DIR
+                ),
+                on_downloaded,
+                self._on_download_error
             )
 
+            self._busy_begin()
+            self.results_text.appendPlainText(f"\nDownloading {selected['name']} from Google Drive...")
+
+    def _on_drive_list_error(self, error_msg: str):
+        """Handle Drive file list error"""
+        self._busy_end()
+
+        QMessageBox.critical(
+            self,
+            "Load Error",
+            f"Failed to load files list: {error_msg}"
+        )
+
     def _on_xml_downloaded(self, file_data: dict):
         """Handle XML file download completion"""
-        self.progress_bar.setVisible(False)
+        self._busy_end()
 
         try:
-            # Save to temporary file
-            import tempfile
-            temp_dir = Path(tempfile.gettempdir())
-            temp_file = temp_dir / file_data['name']
-
-            temp_file.write_text(file_data['content'], encoding='utf-8')
+            # Content was streamed to a temporary file by the download
+            temp_file = file_data['path']
 
             # Update UI
             self.current_xml_file = temp_file
+            self._reset_metadata()
             self.xml_file_label.setText(f"{file_data['name']} (from Drive)")
-            self.xml_file_label.setStyleSheet("color: blue;")
+            self._set_label_status(self.xml_file_label, "drive")
             self.load_data_button.setEnabled(True)
             self.search_button.setEnabled(True)
             self._update_transform_button()
 
-            self.results_text.append(f"Downloaded {file_data['name']} successfully!")
+            self.results_text.appendPlainText(f"Downloaded {file_data['name']} successfully!")
 
-            QMessageBox.information(
-                self,
-                "Success",
-                f"XML file loaded from Google Drive:\n{file_data['name']}"
+            # Non-modal notice; the handler returns without waiting for the user
+            self.statusBar().showMessage(
+                f"XML file loaded from Google Drive: {file_data['name']}",
+                STATUS_MESSAGE_MS
             )
 
         except Exception as e:
@@ -981,28 +1438,24 @@ class MainWindow(QMainWindow):
 
     def _on_xsl_downloaded(self, file_data: dict):
         """Handle XSL file download completion"""
-        self.progress_bar.setVisible(False)
+        self._busy_end()
 
         try:
-            # Save to temporary file
-            import tempfile
-            temp_dir = Path(tempfile.gettempdir())
-            temp_file = temp_dir / file_data['name']
-
-            temp_file.write_text(file_data['content'], encoding='utf-8')
+            # Content was streamed to a temporary file by the download
+            temp_file = file_data['path']
 
             # Update UI
             self.current_xsl_file = temp_file
             self.xsl_file_label.setText(f"{file_data['name']} (from Drive)")
-            self.xsl_file_label.setStyleSheet("color: blue;")
+            self._set_label_status(self.xsl_file_label, "drive")
             self._update_transform_button()
 
-            self.results_text.append(f"Downloaded {file_data['name']} successfully!")
+            self.results_text.appendPlainText(f"Downloaded {file_data['name']} successfully!")
 
-            QMessageBox.information(
-                self,
-                "Success",
-                f"XSL file loaded from Google Drive:\n{file_data['name']}"
+            # Non-modal notice; the handler returns without waiting for the user
+            self.statusBar().showMessage(
+                f"XSL file loaded from Google Drive: {file_data['name']}",
+                STATUS_MESSAGE_MS
             )
 
         except Exception as e:
@@ -1014,7 +1467,7 @@ class MainWindow(QMainWindow):
 
     def _on_download_error(self, error_msg: str):
         """Handle file download error"""
-        self.progress_bar.setVisible(False)
+        self._busy_end()
 
         QMessageBox.critical(
             self,
@@ -1033,13 +1486,20 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            # Clean up worker threads if running
-            if self.worker and self.worker.isRunning():
-                self.worker.terminate()
-                self.worker.wait()
-            if self.drive_worker and self.drive_worker.isRunning():
-                self.drive_worker.terminate()
-                self.drive_worker.wait()
+            # Stop pooled jobs cooperatively: drop queued ones, cancel the
+            # running search and give the rest a bounded time to finish
+            pool = QThreadPool.globalInstance()
+            pool.clear()
+            if self.worker:
+                self.worker.cancel()
+            pool.waitForDone(SHUTDOWN_WAIT_MS)
+
+            # Cancel Drive operations, close their HTTP sessions and stop
+            # the loop, waiting a bounded time for them to unwind
+            self.drive_loop.stop(
+                SHUTDOWN_WAIT_MS,
+                self.drive_storage.close if self.drive_storage else None
+            )
             event.accept()
         else:
             event.ignore()
@@ -1,23 +1,34 @@
+import atexit
+import queue
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TextIO, Union
 
 from .log_level import LogLevel
 
 
+# Buffer of the open log file; the writer thread flushes after each burst
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Queue item: a log line to write, a callable to run on the writer
+# thread, or None to stop the writer
+_LogItem = Union[str, Callable[[], None], None]
+
+
 class Logger:
 
     _instance: Optional['Logger'] = None
     _lock: threading.Lock = threading.Lock()
-    _initialized: bool = False
 
     def __new__(cls, log_file: str = "application.log") -> 'Logger':
         """
         Create or return the singleton instance
 
         This method ensures that only one instance of Logger exists.
-        Uses double-checked locking pattern for thread safety.
+        Uses double-checked locking pattern for thread safety. The instance
+        is fully initialized before it is published, so other threads never
+        see a half-built logger.
 
         Args:
             log_file: Path to the log file (default: "application.log")
@@ -25,31 +36,106 @@ class Logger:
         Returns:
             The singleton Logger instance
         """
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
                 # Double-checked locking
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize(log_file)
+                    cls._instance = instance
+        return instance
 
     def __init__(self, log_file: str = "application.log") -> None:
         """
-        Initialize the logger
-        
+        Accept the constructor argument; all setup happens once in __new__
+
         Args:
             log_file: Path to the log file (default: "application.log")
         """
-        # Ensure initialization happens only once
-        if Logger._initialized:
-            return
 
-        with Logger._lock:
-            if Logger._initialized:
-                return
+    def _initialize(self, log_file: str) -> None:
+        """
+        Set up the singleton instance
 
-            self._log_file_path = Path(log_file)
-            self._ensure_log_file_exists()
-            Logger._initialized = True
+        Args:
+            log_file: Path to the log file
+        """
+        self._log_file_path = Path(log_file)
+        self._disabled_levels: set[LogLevel] = set()
+        # (epoch second, formatted timestamp) of the last event
+        self._timestamp_cache: tuple[int, str] = (-1, "")
+        self._ensure_log_file_exists()
+        self._start_writer()
+
+    def _start_writer(self) -> None:
+        """
+        Open the log file once and start the background writer thread
+
+        Callers only enqueue lines; the writer owns the file handle.
+        """
+        self._file: TextIO = open(
+            self._log_file_path, 'a', encoding='utf-8', buffering=LOG_BUFFER_SIZE
+        )
+        self._queue: queue.SimpleQueue[_LogItem] = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._drain, name='logger-writer', daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _drain(self) -> None:
+        """
+        Write queued items until the stop marker arrives
+
+        Runs on the writer thread. Everything already queued is written
+        before a single flush, so a burst of events costs one write call.
+        """
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        write = self._file.write
+
+        while True:
+            item = get()
+            while True:
+                if item is None:
+                    self._file.flush()
+                    return
+                if isinstance(item, str):
+                    write(item)
+                else:
+                    self._file.flush()
+                    item()
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+            self._file.flush()
+
+    def _run_on_writer(self, action: Callable[[], None]) -> None:
+        """
+        Run action on the writer thread after all queued lines and wait for it
+
+        Args:
+            action: Callable operating on the log file
+        """
+        done = threading.Event()
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                action()
+            except Exception as e:
+                # Reported to the caller; the writer thread keeps running
+                errors.append(e)
+            finally:
+                done.set()
+
+        self._queue.put(run)
+        done.wait()
+        if errors:
+            raise errors[0]
 
     def _ensure_log_file_exists(self) -> None:
         """
@@ -69,11 +155,46 @@ class Logger:
         Returns:
             Formatted timestamp string (dd.mm.yyyy HH:MM:SS)
 
+        The format has second resolution, so events within the same second
+        reuse the string formatted for the first of them.
+        """
+        now = time.time()
+        second = int(now)
+        cached_second, cached = self._timestamp_cache
+        if second == cached_second:
+            return cached
+
+        formatted = time.strftime("%d.%m.%Y %H:%M:%S", time.localtime(now))
+        # Tuple swap keeps second and string consistent across threads
+        self._timestamp_cache = (second, formatted)
+        return formatted
+
+    def set_level_enabled(self, level: LogLevel, enabled: bool) -> None:
         """
-        now = datetime.now()
-        return now.strftime("%d.%m.%Y %H:%M:%S")
+        Enable or disable logging for a given importance level
 
-    def log(self, level: LogLevel, message: str) -> None:
+        Args:
+            level: Event importance level (LogLevel enum)
+            enabled: False to drop events of this level
+        """
+        if enabled:
+            self._disabled_levels.discard(level)
+        else:
+            self._disabled_levels.add(level)
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Check whether events of the given level are written
+
+        Args:
+            level: Event importance level (LogLevel enum)
+
+        Returns:
+            True if the level is enabled
+        """
+        return level not in self._disabled_levels
+
+    def log(self, level: LogLevel, message: str, *args: object) -> None:
         """
         Log an event with timestamp and importance level
 
@@ -82,44 +203,53 @@ class Logger:
 
         Args:
             level: Event importance level (LogLevel enum)
-            message: Descriptive message about the event
+            message: Descriptive message about the event, optionally
+                with %-style placeholders
+            *args: Values for the placeholders; formatting is skipped
+                entirely when the level is disabled
 
         Thread-safe: Multiple threads can safely call this method concurrently.
+        The line is queued for the writer thread; the caller never waits on disk.
         """
-        timestamp = self._format_timestamp()
-        log_entry = f"{timestamp} {level}. {message}\n"
+        if level in self._disabled_levels:
+            return
 
-        with Logger._lock:
-            with open(self._log_file_path, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+        if args:
+            message = message % args
 
-    def log_filtering(self, message: str) -> None:
+        timestamp = self._format_timestamp()
+        self._queue.put(f"{timestamp} {level.value}. {message}\n")
+
+    def log_filtering(self, message: str, *args: object) -> None:
         """
         Convenience method for logging filtering events
 
         Args:
             message: Descriptive message about the filtering operation
+            *args: Values for %-style placeholders in message
 
         """
-        self.log(LogLevel.FILTERING, message)
+        self.log(LogLevel.FILTERING, message, *args)
 
-    def log_transformation(self, message: str) -> None:
+    def log_transformation(self, message: str, *args: object) -> None:
         """
         Convenience method for logging transformation events
 
         Args:
             message: Descriptive message about the transformation operation
+            *args: Values for %-style placeholders in message
         """
-        self.log(LogLevel.TRANSFORMATION, message)
+        self.log(LogLevel.TRANSFORMATION, message, *args)
 
-    def log_saving(self, message: str) -> None:
+    def log_saving(self, message: str, *args: object) -> None:
         """
         Convenience method for logging saving events
 
         Args:
             message: Descriptive message about the saving operation
+            *args: Values for %-style placeholders in message
         """
-        self.log(LogLevel.SAVING, message)
+        self.log(LogLevel.SAVING, message, *args)
 
     def get_log_file_path(self) -> Path:
         """
@@ -130,19 +260,40 @@ class Logger:
         """
         return self._log_file_path
 
+    def flush(self) -> None:
+        """
+        Wait until every event logged so far is written to the log file
+        """
+        if self._writer.is_alive():
+            self._run_on_writer(lambda: None)
+
     def clear_log(self) -> None:
         """
         Clear all contents of the log file
         """
-        with Logger._lock:
+        if self._writer.is_alive():
+            # Events logged before the call are discarded with the rest
+            self._run_on_writer(lambda: self._file.truncate(0))
+        else:
             with open(self._log_file_path, 'w', encoding='utf-8') as f:
                 f.write("")
 
+    def close(self) -> None:
+        """
+        Write pending events, stop the writer thread and close the log file
+        """
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._file.close()
+        atexit.unregister(self.close)
+
     @classmethod
     def reset_instance(cls) -> None:
         """
         Reset the singleton instance
         """
         with cls._lock:
+            if cls._instance is not None:
+                cls._instance.close()
             cls._instance = None
-            cls._initialized = False
@@ -1,15 +1,39 @@
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
-from typing import List
+import io
+from typing import BinaryIO, Callable, List, Optional
 
 from src.models.search_models import SearchResult, ParsedElement
 
 
+# Крок відступу у форматованому XML
+_INDENT = "  "
+
+
+def _escape(data: str) -> str:
+    """Екранує спецсимволи XML у тексті та значеннях атрибутів."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace("\"", "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def _write_leaf(write: Callable[[str], int], indent: str, tag: str, text: Optional[str]) -> None:
+    """Записує елемент з текстом або порожній елемент в один рядок."""
+    if text:
+        write(f"{indent}<{tag}>{_escape(text)}</{tag}>\n")
+    else:
+        write(f"{indent}<{tag}/>\n")
+
+
 class SearchResultXMLConverter:
     """
     Конвертує результати пошуку в XML формат.
 
     Відповідальність: трансформація SearchResult в XML документ.
+
+    XML пишеться потоково, елемент за елементом, без побудови дерева
+    в пам'яті; форматування збігається з minidom.toprettyxml(indent="  ").
     """
 
     @staticmethod
@@ -44,95 +68,130 @@ class SearchResultXMLConverter:
                 </results>
             </searchResults>
         """
-        root = Element('searchResults')
+        buffer = io.BytesIO()
+        SearchResultXMLConverter.write_xml(search_result, buffer)
+        return buffer.getvalue().decode('utf-8')
 
-        # Додаємо метадані
-        metadata = SubElement(root, 'metadata')
+    @staticmethod
+    def write_xml(search_result: SearchResult, fileobj: BinaryIO) -> None:
+        """
+        Потоково записує SearchResult як XML у UTF-8 у бінарний файл.
 
-        parser_type = SubElement(metadata, 'parserType')
-        parser_type.text = search_result.parser_type
+        Пам'ять не залежить від кількості результатів: кожен елемент
+        записується одразу після форматування.
 
-        element_name = SubElement(metadata, 'elementName')
-        element_name.text = search_result.query.element_name
+        Args:
+            search_result: Результати пошуку для конвертації
+            fileobj: Бінарний файловий об'єкт (файл, BytesIO, SpooledTemporaryFile)
+        """
+        writer = io.TextIOWrapper(fileobj, encoding='utf-8', newline='\n')
+        try:
+            write = writer.write
+            write('<?xml version="1.0" encoding="utf-8"?>\n')
+            write("<searchResults>\n")
 
-        if search_result.query.attribute_name:
-            attr_filter = SubElement(metadata, 'attributeFilter')
-            attr_name = SubElement(attr_filter, 'name')
-            attr_name.text = search_result.query.attribute_name
-            attr_value = SubElement(attr_filter, 'value')
-            attr_value.text = search_result.query.attribute_value or ''
+            # Додаємо метадані
+            query = search_result.query
+            indent = _INDENT * 2
+            write(f"{_INDENT}<metadata>\n")
+            _write_leaf(write, indent, 'parserType', search_result.parser_type)
+            _write_leaf(write, indent, 'elementName', query.element_name)
 
-        if search_result.query.text_contains:
-            text_filter = SubElement(metadata, 'textFilter')
-            text_filter.text = search_result.query.text_contains
+            if query.attribute_name:
+                write(f"{indent}<attributeFilter>\n")
+                _write_leaf(write, indent + _INDENT, 'name', query.attribute_name)
+                _write_leaf(write, indent + _INDENT, 'value', query.attribute_value or '')
+                write(f"{indent}</attributeFilter>\n")
 
-        results_count = SubElement(metadata, 'resultsCount')
-        results_count.text = str(search_result.get_count())
+            if query.text_contains:
+                _write_leaf(write, indent, 'textFilter', query.text_contains)
 
-        execution_time = SubElement(metadata, 'executionTime')
-        execution_time.text = f"{search_result.execution_time_ms:.2f}"
+            _write_leaf(write, indent, 'resultsCount', str(search_result.get_count()))
+            _write_leaf(write, indent, 'executionTime', f"{search_result.execution_time_ms:.2f}")
+            write(f"{_INDENT}</metadata>\n")
 
-        # Додаємо результати
-        results = SubElement(root, 'results')
+            # Додаємо результати
+            SearchResultXMLConverter._write_results(write, _INDENT, search_result.elements)
 
-        for parsed_elem in search_result.elements:
-            SearchResultXMLConverter._add_element(results, parsed_elem)
+            write("</searchResults>\n")
+        finally:
+            # Від'єднання скидає буфер і залишає fileobj відкритим
+            writer.detach()
 
-        # Форматуємо XML для читабельності
-        return SearchResultXMLConverter._prettify_xml(root)
+    @staticmethod
+    def _write_results(
+        write: Callable[[str], int],
+        indent: str,
+        elements: List[ParsedElement]
+    ) -> None:
+        """
+        Записує список результатів у елемент <results>.
+
+        Args:
+            write: Функція запису тексту
+            indent: Поточний відступ
+            elements: ParsedElement для запису
+        """
+        if not elements:
+            write(f"{indent}<results/>\n")
+            return
+
+        write(f"{indent}<results>\n")
+        child_indent = indent + _INDENT
+        for parsed_elem in elements:
+            SearchResultXMLConverter._write_element(write, child_indent, parsed_elem)
+        write(f"{indent}</results>\n")
 
     @staticmethod
-    def _add_element(parent: Element, parsed_elem: ParsedElement) -> None:
+    def _write_element(
+        write: Callable[[str], int],
+        indent: str,
+        parsed_elem: ParsedElement
+    ) -> None:
         """
-        Додає ParsedElement до XML дерева.
+        Записує ParsedElement як елемент <element>.
 
         Args:
-            parent: Батьківський XML елемент
-            parsed_elem: ParsedElement для додавання
+            write: Функція запису тексту
+            indent: Поточний відступ
+            parsed_elem: ParsedElement для запису
         """
-        element = SubElement(parent, 'element')
+        inner = indent + _INDENT
+        write(f"{indent}<element>\n")
 
         # Тег елемента
-        tag = SubElement(element, 'tag')
-        tag.text = parsed_elem.tag
+        _write_leaf(write, inner, 'tag', parsed_elem.tag)
 
         # Шлях елемента
-        if parsed_elem.path:
-            path = SubElement(element, 'path')
-            path.text = parsed_elem.path
+        path = parsed_elem.path
+        if path:
+            _write_leaf(write, inner, 'path', path)
 
         # Атрибути
-        if parsed_elem.attributes:
-            attributes = SubElement(element, 'attributes')
-            for attr_name, attr_value in parsed_elem.attributes.items():
-                attr = SubElement(attributes, 'attribute')
-                attr.set('name', attr_name)
-                attr.set('value', attr_value)
-
-        # Текстовий контент
-        if parsed_elem.text and parsed_elem.text.strip():
-            text = SubElement(element, 'text')
-            text.text = parsed_elem.text.strip()
+        attributes = parsed_elem.attributes
+        if attributes:
+            write(f"{inner}<attributes>\n")
+            attr_indent = inner + _INDENT
+            for attr_name, attr_value in attributes.items():
+                write(
+                    f'{attr_indent}<attribute name="{_escape(attr_name)}" '
+                    f'value="{_escape(attr_value)}"/>\n'
+                )
+            write(f"{inner}</attributes>\n")
+
+        # Текстовий контент; strip() виконується один раз і лише для непорожнього тексту
+        text = parsed_elem.text
+        if text:
+            text = text.strip()
+            if text:
+                _write_leaf(write, inner, 'text', text)
 
         # Кількість дочірніх елементів
-        if parsed_elem.children:
-            children_count = SubElement(element, 'childrenCount')
-            children_count.text = str(len(parsed_elem.children))
-
-    @staticmethod
-    def _prettify_xml(elem: Element) -> str:
-        """
-        Форматує XML для читабельності.
-
-        Args:
-            elem: Корневий елемент XML
+        children = parsed_elem.children
+        if children:
+            _write_leaf(write, inner, 'childrenCount', str(len(children)))
 
-        Returns:
-            str: Відформатований XML рядок
-        """
-        rough_string = tostring(elem, encoding='utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ", encoding='utf-8').decode('utf-8')
+        write(f"{indent}</element>\n")
 
     @staticmethod
     def convert_multiple_to_xml(search_results: List[SearchResult]) -> str:
@@ -145,27 +204,30 @@ class SearchResultXMLConverter:
         Returns:
             str: Відформатований XML рядок з усіма результатами
         """
-        root = Element('multipleSearchResults')
+        buffer = io.StringIO()
+        write = buffer.write
+        write('<?xml version="1.0" encoding="utf-8"?>\n')
+
+        if not search_results:
+            write("<multipleSearchResults/>\n")
+            return buffer.getvalue()
 
+        write("<multipleSearchResults>\n")
+        indent = _INDENT * 2
         for idx, result in enumerate(search_results, 1):
-            search_elem = SubElement(root, 'searchResult')
-            search_elem.set('index', str(idx))
+            write(f'{_INDENT}<searchResult index="{idx}">\n')
 
             # Додаємо метадані
-            metadata = SubElement(search_elem, 'metadata')
-
-            parser_type = SubElement(metadata, 'parserType')
-            parser_type.text = result.parser_type
-
-            element_name = SubElement(metadata, 'elementName')
-            element_name.text = result.query.element_name
-
-            results_count = SubElement(metadata, 'resultsCount')
-            results_count.text = str(result.get_count())
+            write(f"{indent}<metadata>\n")
+            _write_leaf(write, indent + _INDENT, 'parserType', result.parser_type)
+            _write_leaf(write, indent + _INDENT, 'elementName', result.query.element_name)
+            _write_leaf(write, indent + _INDENT, 'resultsCount', str(result.get_count()))
+            write(f"{indent}</metadata>\n")
 
             # Додаємо результати
-            results = SubElement(search_elem, 'results')
-            for parsed_elem in result.elements:
-                SearchResultXMLConverter._add_element(results, parsed_elem)
+            SearchResultXMLConverter._write_results(write, indent, result.elements)
+
+            write(f"{_INDENT}</searchResult>\n")
+        write("</multipleSearchResults>\n")
 
-        return SearchResultXMLConverter._prettify_xml(root)
+        return buffer.getvalue()